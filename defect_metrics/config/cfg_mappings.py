@@ -1,7 +1,11 @@
 from collections import OrderedDict
-from dataclasses import dataclass
+import copy
+import functools
+import hashlib
+import pickle
 import pprint
 import os
+import tempfile
 import typing
 import yaml
 
@@ -9,6 +13,15 @@ import defect_metrics.logging.logger as logger
 
 YAML = 'yaml'
 
+# Use the libyaml-backed loader when PyYAML was built with it; otherwise use the pure-python safe loader.
+Loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Parsed configs are pickled here, keyed by file path, mtime and size.
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'defect_metrics')
+
+# Version of the cached config contents; increment when the parsing changes what is cached.
+CACHE_VERSION = 2
+
 logging = logger.Logger()
 
 
@@ -24,10 +37,10 @@ class ConfigFileType:
         if not os.path.exists(self.file):
             logging.warn(f"Can't find {self.file}")
         else:
-            self.mappings, self.cfg = self.read_config_file()
+            self.mappings, self.cfg = self.read_config_file(pillar=self.pillar)
             self.order = self.get_order()
 
-    def read_config_file(self):
+    def read_config_file(self, pillar: str = None):
         raise NotImplementedError
 
     def get_order(self):
@@ -72,13 +85,106 @@ def get_configuration(mapping_file: str, pillar: str, order_key: str = 'order')
 
 
 def get_pillars(mapping_file: str) -> typing.List[str]:
-    with open(mapping_file, "r") as FILE:
-        cfg = yaml.load(FILE, Loader=yaml.FullLoader)
+    # Return a copy; the sorted tuple is cached and shared by all callers.
+    return list(_get_pillars(os.path.abspath(mapping_file), os.stat(mapping_file).st_mtime_ns))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_pillars(path: str, mtime_ns: int) -> typing.Tuple[str, ...]:
+    # mtime_ns is only part of the cache key, so an edited file is re-read.
+    cfg = _load_cached(path)
+    return tuple(sorted(cfg.keys()))
+
+
+def _load_single_pillar(path: str, pillar: str) -> dict:
+    """
+    Load only the requested pillar from the YAML config file. The document is composed into nodes
+    (in libyaml), but only the selected pillar's subtree is constructed into python objects.
+
+    :param path: Path to the YAML config file
+    :param pillar: Name of the pillar to load
+
+    :return: Parsed config (dict) containing only the requested pillar (empty if the pillar is not defined)
+
+    """
+    with open(path, "r") as FILE:
+        loader = Loader(FILE.read())
+
+    try:
+        root = loader.get_single_node()
+        if not isinstance(root, yaml.MappingNode):
+            return {}
+
+        # As with a full load, the last definition of a duplicated pillar is the one that is used.
+        pillar_node = None
+        for key_node, value_node in root.value:
+            if isinstance(key_node, yaml.ScalarNode) and key_node.value == pillar:
+                pillar_node = value_node
+        if pillar_node is None:
+            return {}
+        return {pillar: loader.construct_document(pillar_node)}
+
+    finally:
+        loader.dispose()
+
+
+def _load_cached(path: str, pillar: str = None) -> dict:
+    """
+    Load the YAML config file. A file that has not changed is only loaded once per run (the parsed config is
+    shared by all callers, so it must not be modified), and is read from the on-disk pickle of a previous parse.
 
-    return sorted(cfg.keys())
+    :param path: Path to the YAML config file
+    :param pillar: If provided, only load this pillar (see _load_single_pillar); otherwise load all pillars.
+
+    :return: Parsed config (dict)
+
+    """
+    stat = os.stat(path)
+    return _load_memoized(os.path.abspath(path), stat.st_mtime_ns, stat.st_size, pillar)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_memoized(path: str, mtime_ns: int, size: int, pillar: typing.Optional[str]) -> dict:
+    """
+    Load the YAML config file, using the on-disk pickle of a previous parse if the file has not changed.
+    The mtime and size are part of the (in-memory and on-disk) cache keys, so an edited file is re-read.
+
+    :param path: Absolute path to the YAML config file
+    :param mtime_ns: Modification time of the file (ns)
+    :param size: Size of the file (bytes)
+    :param pillar: If provided, only load this pillar (see _load_single_pillar); otherwise load all pillars.
+
+    :return: Parsed config (dict)
+
+    """
+    key = hashlib.blake2b(f"{CACHE_VERSION}:{path}:{mtime_ns}:{size}:{pillar or ''}".encode()).hexdigest()
+    cache_file = os.path.join(CACHE_DIR, f"{key}.pkl")
+
+    try:
+        with open(cache_file, "rb") as CACHE:
+            return pickle.load(CACHE)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    if pillar is not None:
+        cfg = _load_single_pillar(path, pillar)
+    else:
+        with open(path, "r") as FILE:
+            cfg = yaml.load(FILE.read(), Loader=Loader)
+
+    # Write to a temp file and rename, so a concurrent reader never sees a partial pickle.
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_file = tempfile.mkstemp(dir=CACHE_DIR, suffix='.tmp')
+        with os.fdopen(fd, "wb") as CACHE:
+            pickle.dump(cfg, CACHE, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_file, cache_file)
+    except OSError as err:
+        logging.debug(f"Unable to cache parsed config '{path}': {err}")
+
+    return cfg
 
 
-@dataclass
 class YamlKeywords:
     STATES: str = 'states'
     SPRINTS: str = 'sprints'
@@ -91,63 +197,72 @@ class YamlKeywords:
 
 class YamlFile(ConfigFileType):
 
-    def read_config_file(self) -> typing.Tuple[dict, dict]:
+    def read_config_file(self, pillar: str = None) -> typing.Tuple[dict, dict]:
+        """
+        Read the config file and build the (alternate state --> state) mappings.
+
+        :param pillar: Only build the mappings for this pillar; if None, build them for all pillars.
+
+        :return: Tuple of (mappings by pillar, config)
+
+        """
         mappings = {}
 
-        with open(self.file, "r") as FILE:
-            self.cfg = yaml.load(FILE, Loader=yaml.FullLoader)
+        # When a pillar is selected, only that pillar's section is loaded. The parsed config is shared by all
+        # callers of _load_cached, so the instance takes its own copy once; the getters return from that copy.
+        self.cfg = copy.deepcopy(_load_cached(self.file, pillar=pillar))
 
         for pillar, info_dict in self.cfg.items():
             logging.info(f"Pillar: {pillar}")
 
             mappings[pillar] = {}
             for state, equiv_list in info_dict[YamlKeywords.STATES].items():
-                mappings[pillar].update(dict([(equiv, state) for equiv in equiv_list]))
+                for equiv in equiv_list:
+                    if equiv in mappings[pillar]:
+                        logging.warn(f"{pillar}: '{equiv}' is defined under both '{mappings[pillar][equiv]}' "
+                                     f"and '{state}'; using '{state}'.")
+                mappings[pillar].update({equiv: state for equiv in equiv_list})
 
         return mappings, self.cfg
 
     def get_defined_pillars(self) -> typing.List[str]:
-        return sorted(self.cfg.keys())
+        # self.cfg may only contain the selected pillar; get_pillars() caches the sorted names.
+        return get_pillars(self.file)
+
+    def _get_value(self, key: str) -> typing.Any:
+        return self.cfg[self.pillar].get(key, None)
 
     def get_order(self) -> str:
-        target = self.cfg[self.pillar]
-        return target.get(self.reserved_section, None)
+        return self._get_value(self.reserved_section)
 
     def get_sprints(self) -> typing.Dict:
-        target = self.cfg[self.pillar]
-        sprints = target.get(YamlKeywords.SPRINTS, None)
+        sprints = self._get_value(YamlKeywords.SPRINTS)
         if sprints is not None:
-            data = [(k, v) for k, v in sprints.items()]
-            sprints = OrderedDict(sorted(data, key=lambda sprint: sprint[1][0]))
+            sprints = OrderedDict(sorted(sprints.items(), key=lambda sprint: sprint[1][0]))
         return sprints
 
     def get_projects(self) -> typing.List:
-        target = self.cfg[self.pillar]
-        return target.get(YamlKeywords.PROJECTS, None)
+        return self._get_value(YamlKeywords.PROJECTS)
 
     def get_sprint_interval(self) -> str:
-        target = self.cfg[self.pillar]
-        return target.get(YamlKeywords.INTERVAL, None)
+        return self._get_value(YamlKeywords.INTERVAL)
 
     def get_labels(self) -> typing.List[str]:
-        target = self.cfg[self.pillar]
-        return target.get(YamlKeywords.LABELS, None)
+        return self._get_value(YamlKeywords.LABELS)
 
     def get_url(self) -> str:
-        target = self.cfg[self.pillar]
-        return target.get(YamlKeywords.URL, None)
+        return self._get_value(YamlKeywords.URL)
 
     def get_subproducts(self) -> typing.List[str]:
-        target = self.cfg[self.pillar]
-        return target.get(YamlKeywords.PRODUCTS, None)
+        return self._get_value(YamlKeywords.PRODUCTS)
 
     def get_reverse_status_mappings(self) -> typing.Dict[str, str]:
-        states = self.cfg[self.pillar][YamlKeywords.STATES]
-        reverse_mappings = dict([(a_s, state) for state, alt_states in states.items() for a_s in alt_states])
-        return reverse_mappings
+        # read_config_file() already built this instance's (alternate state --> state) mapping per pillar.
+        return self.mappings[self.pillar]
 
     def get_pillar_project_info(self) -> str:
-        output = "\nList of defined Pillars and Jira Projects:\n"
-        for pillar in self.get_defined_pillars():
-            output += f"\n * {pillar}:\n    - {', '.join(self.cfg[pillar][YamlKeywords.PROJECTS])}\n"
-        return output
+        cfg = _load_cached(self.file)
+        output = ["\nList of defined Pillars and Jira Projects:\n"]
+        output.extend(f"\n * {pillar}:\n    - {', '.join(cfg[pillar][YamlKeywords.PROJECTS])}\n"
+                      for pillar in self.get_defined_pillars())
+        return ''.join(output)
@@ -1,14 +1,15 @@
 import argparse
-import dataclasses
 import os
 import sys
 import typing
 
 
-@dataclasses.dataclass
 class cli_consts:
     DEFAULT_NUM_BUGS: int = 200
     DEFAULT_FILE_FMT: str = 'csv'
+    DEFAULT_BATCH_SIZE: int = 500
+    DEFAULT_JIRA_CONCURRENCY: int = 16
+    DEFAULT_CACHE_TTL: int = 3600
 
     SSO_USER: str = 'SSO_USER'
     SSO_PASS: str = 'SSO_PASS'
@@ -21,38 +22,118 @@ class cli_consts:
     END: str = 'end'
     LIST: str = 'list'
     DEBUG: str = 'debug'
+    BATCH_SIZE: str = 'batch-size'
+    JIRA_CONCURRENCY: str = 'jira-concurrency'
+    CACHE_DIR: str = 'cache-dir'
+    CACHE_TTL: str = 'cache-ttl'
+    JIRA_RPS: str = 'jira-rps'
     ALL: str = 'ALL'
 
+
+USER_HELP = ("REQUIRED: Jira Login Username; SSO Username; if not provided, use environ var "
+             f"'{cli_consts.SSO_USER}'. NOTE: CLI gets priority over the envvars.")
+PSWD_HELP = ("REQUIRED: Jira Login Password; SSO Password; if not provided, use environ var "
+             f"'{cli_consts.SSO_PASS}'. NOTE: CLI gets priority over the envvars.")
+CFG_HELP = "REQUIRED: Config file to use"
+PILLAR_HELP = f"REQUIRED: Name of pillar; must be defined in the config file, or '{cli_consts.ALL}' for all pillars"
+START_HELP = "REQUIRED: Start Date Range: YYYY-MM-DD"
+END_HELP = "REQUIRED: End Date Range: YYYY-MM-DD"
+LIST_HELP = "List all defined pillars and projects"
+DEBUG_HELP = "Enable debug logging"
+BATCH_SIZE_HELP = (f"Number of issues requested per Jira search page (default: {cli_consts.DEFAULT_BATCH_SIZE}); "
+                   "Jira may cap this (jira.search.views.default.max)")
+CACHE_DIR_HELP = "Directory used to cache Jira results between runs (no caching if not provided)"
+CACHE_TTL_HELP = (f"Seconds that cached query results are reused without querying Jira "
+                  f"(default: {cli_consts.DEFAULT_CACHE_TTL}; 0 disables the query cache); "
+                  f"requires '--{cli_consts.CACHE_DIR}'")
+JIRA_RPS_HELP = "Maximum number of requests per second made to Jira, across all pillars (default: no limit)"
+JIRA_CONCURRENCY_HELP = f"Number of concurrent Jira requests per query (default: {cli_consts.DEFAULT_JIRA_CONCURRENCY})"
+
+
+def _bounded(value_type: typing.Callable[[str], typing.Any], allow_zero: bool) -> typing.Callable[[str], typing.Any]:
+    """
+    Build an argparse type that converts the argument with value_type and requires it to be greater than zero
+    (or, when allow_zero is set, not less than zero).
+
+    :param value_type: Conversion of the argument string (e.g. - int, float)
+    :param allow_zero: Accept zero as a valid value
+
+    :return: Conversion routine for the argparse 'type' keyword
+
+    """
+    kind = "non-negative" if allow_zero else "positive"
+
+    def convert(value: str) -> typing.Any:
+        try:
+            number = value_type(value)
+        except ValueError:
+            number = None
+        if number is None or not (number >= 0 if allow_zero else number > 0):
+            raise argparse.ArgumentTypeError(f"'{value}' is not a {kind} {value_type.__name__}")
+        return number
+
+    return convert
+
+
+def _positive(value_type: typing.Callable[[str], typing.Any]) -> typing.Callable[[str], typing.Any]:
+    """
+    Build an argparse type that converts the argument with value_type and requires it to be greater than zero.
+
+    :param value_type: Conversion of the argument string (e.g. - int, float)
+
+    :return: Conversion routine for the argparse 'type' keyword
+
+    """
+    return _bounded(value_type, allow_zero=False)
+
+
+def _non_negative(value_type: typing.Callable[[str], typing.Any]) -> typing.Callable[[str], typing.Any]:
+    """
+    Build an argparse type that converts the argument with value_type and requires it to be zero or greater.
+
+    :param value_type: Conversion of the argument string (e.g. - int, float)
+
+    :return: Conversion routine for the argparse 'type' keyword
+
+    """
+    return _bounded(value_type, allow_zero=True)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("-u", f"--{cli_consts.USER}", help=USER_HELP)
+    parser.add_argument("-p", f"--{cli_consts.PSWD}", help=PSWD_HELP)
+    parser.add_argument("-c", f"--{cli_consts.CFG}", help=CFG_HELP)
+    parser.add_argument("-r", f"--{cli_consts.PILLAR}", nargs='*', help=PILLAR_HELP)
+    parser.add_argument("-s", f"--{cli_consts.START}", help=START_HELP)
+    parser.add_argument("-e", f"--{cli_consts.END}", help=END_HELP)
+    parser.add_argument("-b", f"--{cli_consts.BATCH_SIZE}", type=_positive(int), default=cli_consts.DEFAULT_BATCH_SIZE,
+                        help=BATCH_SIZE_HELP)
+    parser.add_argument(f"--{cli_consts.JIRA_CONCURRENCY}", type=_positive(int),
+                        default=cli_consts.DEFAULT_JIRA_CONCURRENCY, help=JIRA_CONCURRENCY_HELP)
+    parser.add_argument(f"--{cli_consts.JIRA_RPS}", type=_positive(float), help=JIRA_RPS_HELP)
+    parser.add_argument(f"--{cli_consts.CACHE_DIR}", help=CACHE_DIR_HELP)
+    parser.add_argument(f"--{cli_consts.CACHE_TTL}", type=_non_negative(int), default=cli_consts.DEFAULT_CACHE_TTL,
+                        help=CACHE_TTL_HELP)
+
+    parser.add_argument("-l", f"--{cli_consts.LIST}", help=LIST_HELP, action="store_true", default=False)
+    parser.add_argument("-d", f"--{cli_consts.DEBUG}", action="store_true", help=DEBUG_HELP)
+    return parser
+
+
+# The parser definition is static, so build it once at import.
+_PARSER = _build_parser()
+
+
 class CommandLine:
 
     consts = cli_consts
 
     def __init__(self):
-        self.parser = argparse.ArgumentParser()
-        self.add_args()
+        self.parser = _PARSER
         self.args = self.parser.parse_args()
         self.check_for_required_elements(namespace=self.args)
 
-    def add_args(self) -> typing.NoReturn:
-        self.parser.add_argument("-u", f"--{self.consts.USER}",
-                                 help="REQUIRED: Jira Login Username; SSO Username; if not "
-                                      f"provided, use environ var '{self.consts.SSO_USER}'. NOTE: CLI "
-                                      f"gets priority over the envvars.")
-        self.parser.add_argument("-p", f"--{self.consts.PSWD}",
-                                 help="REQUIRED: Jira Login Password; SSO Password; if not "
-                                      f"provided, use environ var '{self.consts.SSO_PASS}'. NOTE: CLI "
-                                      f"gets priority over the envvars.")
-        self.parser.add_argument("-c", f"--{self.consts.CFG}", help="REQUIRED: Config file to use")
-        self.parser.add_argument("-r", f"--{self.consts.PILLAR}", nargs='*',
-                                 help="REQUIRED: Name of pillar; must be defined in the "
-                                 f"config file, or '{self.consts.ALL}' for all pillars")
-        self.parser.add_argument("-s", f"--{self.consts.START}", help="REQUIRED: Start Date Range: YYYY-MM-DD")
-        self.parser.add_argument("-e", f"--{self.consts.END}", help="REQUIRED: End Date Range: YYYY-MM-DD")
-
-        self.parser.add_argument("-l", f"--list", help="List all defined pillars and projects",
-                                 action="store_true", default=False)
-        self.parser.add_argument("-d", f"--{self.consts.DEBUG}", action="store_true", help="Enable debug logging")
-
     def check_for_required_elements(self, namespace: argparse.Namespace) -> typing.NoReturn:
 
         # List of required args (but wanted to use -<opt> and --<option>, which are not required args per argparse)
@@ -64,21 +145,24 @@ class CommandLine:
             return
 
         # Determine which are missing. Missing args are not defined in the namespace.
-        missing = [arg for arg in required if getattr(namespace, arg) is None]
+        ns = vars(namespace)
+        missing = {arg for arg in required if ns.get(arg) is None}
 
         # Check if the auth vars are missing from the CLI.
         # If an arg is not on the CLI but is defined in the env vars
         #    add the arg + env_var value to the args namespace,
-        #    remove the arg name from the missing list.
+        #    remove the arg name from the missing set.
         for auth_arg, env_var_name in auth_env_vars:
-            if auth_arg in missing and os.getenv(env_var_name) is not None:
-                setattr(namespace, auth_arg, os.getenv(env_var_name))
-                missing.remove(auth_arg)
+            if auth_arg in missing:
+                env_value = os.environ.get(env_var_name)
+                if env_value is not None:
+                    setattr(namespace, auth_arg, env_value)
+                    missing.discard(auth_arg)
 
-        # Display all missing args and exit. If None are missing, return.
+        # Display all missing args (in the order listed above) and exit. If None are missing, return.
         if missing:
             print("\nERRORS: Need to provide the following non-None arguments on the CLI.")
-            for arg in missing:
+            for arg in [arg for arg in required if arg in missing]:
                 print(f"\tNeed: '--{arg}'.")
             print()
 
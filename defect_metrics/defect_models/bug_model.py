@@ -1,5 +1,6 @@
 from collections import OrderedDict
-from dataclasses import dataclass
+from itertools import groupby
+import operator
 import typing
 
 from defect_metrics.config.cfg_mappings import ConfigFileType
@@ -9,7 +10,6 @@ import defect_metrics.logging.logger as logger
 logging = logger.Logger()
 
 
-@dataclass
 class BugKeys:
     ASSIGNEE: str = 'assignee'
     BUG_TYPE: str = 'bug_type'
@@ -45,42 +45,29 @@ class RequiredFields:
     SEVERITY = BugKeys.SEVERITY
     ENVIRONMENT = BugKeys.ENVIRONMENT
     COMPONENT = BugKeys.COMPONENT
-    REQUIRED = [COMPONENT, ENVIRONMENT, PRIORITY, SEVERITY]
+    REQUIRED = (COMPONENT, ENVIRONMENT, PRIORITY, SEVERITY)
 
 
-class Bug(object):
+# Fetch the validated attributes in one call per bug (see Bugs.validate)
+_get_required_fields = operator.attrgetter(*RequiredFields.REQUIRED)
+_get_reporter_and_link = operator.attrgetter(BugKeys.REPORTER, BugKeys.LINK)
+
+
+class Bug:
+    __slots__ = ('_raw', '_data')
+
+    # Attributes to report (in semi-logical order); the same for every Bug.
+    reportable_attributes = (
+        'defect_id', 'title', 'project', 'severity', 'component_list', 'labels', 'priority', 'status', 'detected',
+        'fixed_in', 'created', 'states_list', 'reporter', 'assignee', 'is_valid', 'pillar', 'states_unique_summary',
+        'link')
+
     def __init__(self, **kwargs):
-        self._defect_id = kwargs.get(BugKeys.DEFECT_ID)
-        self._status = kwargs.get(BugKeys.STATUS)
-        self._project = kwargs.get(BugKeys.PROJECT)
-        self._title = kwargs.get(BugKeys.TITLE)
-        self._description = kwargs.get(BugKeys.DESCRIPTION)
-        self._priority = kwargs.get(BugKeys.PRIORITY)
-        self._severity = kwargs.get(BugKeys.SEVERITY)
-        self._environment = kwargs.get(BugKeys.ENVIRONMENT)
-        self._version = kwargs.get(BugKeys.VERSION)
-        self._pillar = kwargs.get(BugKeys.PILLAR)
-
-        self._link = kwargs.get(BugKeys.LINK)
-        self._assignee = kwargs.get(BugKeys.ASSIGNEE)
-        self._reporter = kwargs.get(BugKeys.REPORTER)
-        self._fixed_in = kwargs.get(BugKeys.FIXED_IN)
-        self._labels = kwargs.get(BugKeys.LABELS)
-        self._history = kwargs.get(BugKeys.HISTORY, [])
-        self._states_summary = kwargs.get(BugKeys.STATES_SUMMARY, [])
-        self._detected = kwargs.get(BugKeys.DETECTED)
-
-        self._bug_type = kwargs.get(BugKeys.BUG_TYPE)
-        self._component = kwargs.get(BugKeys.COMPONENT)
-        self._created = kwargs.get(BugKeys.CREATED)
-        self._source = kwargs.get(BugKeys.SOURCE)
-        self._valid = kwargs.get(BugKeys.VALID, True)
-        self._states = kwargs.get(BugKeys.STATES, {})
-
-        self.reportable_attributes = [
-            'defect_id', 'title', 'project', 'severity', 'component_list', 'labels', 'priority', 'status', 'detected',
-            'fixed_in', 'created', 'states_list', 'reporter', 'assignee', 'is_valid', 'pillar', 'states_unique_summary',
-            'link']
+        # Keep the provided data as-is; each attribute is read from it when requested.
+        self._raw = kwargs
+
+        # Reportable data, built on first use (Bug attributes are not changed after creation)
+        self._data = None
 
     def __str__(self):
         fmt = """
@@ -101,166 +88,163 @@ class Bug(object):
         States: {states_list}
         Concise Summary: {states_unique_summary}"""
 
-        data = self.as_dict()
+        data = self._get_data()
         return fmt.format(**data)
 
     def _get_data(self) -> typing.Dict[str, str]:
-        # Attributes to return (in semi-logical order)
-        return OrderedDict([(attr, getattr(self, attr)) for attr in self.reportable_attributes])
+        if self._data is None:
+            self._data = OrderedDict([(attr, getattr(self, attr)) for attr in self.reportable_attributes])
+        return self._data
 
     def as_dict(self):
-        return self._get_data()
+        # Copy, so callers cannot alter the cached data
+        return self._get_data().copy()
 
     @property
     def defect_id(self):
-        return self._defect_id
+        return self._raw.get(BugKeys.DEFECT_ID)
 
     @property
     def pillar(self):
-        return self._pillar
+        return self._raw.get(BugKeys.PILLAR)
 
     @property
     def project(self):
-        return self._project
+        return self._raw.get(BugKeys.PROJECT)
 
     @property
     def status(self):
-        return self._status.capitalize()
+        return self._raw.get(BugKeys.STATUS).capitalize()
 
     @property
     def title(self):
-        return self._title
+        return self._raw.get(BugKeys.TITLE)
 
     @property
     def description(self):
-        return self._description
+        return self._raw.get(BugKeys.DESCRIPTION)
 
     @property
     def priority(self):
-        return self._priority
+        return self._raw.get(BugKeys.PRIORITY)
 
     @property
     def severity(self):
-        return self._severity
+        return self._raw.get(BugKeys.SEVERITY)
 
     @property
     def environment(self):
-        return self._environment
+        return self._raw.get(BugKeys.ENVIRONMENT)
 
     @property
     def version(self):
-        return self._version
+        return self._raw.get(BugKeys.VERSION)
 
     @property
     def bug_type(self):
-        return self._bug_type
+        return self._raw.get(BugKeys.BUG_TYPE)
 
     @property
     def component_list(self):
-        return ', '.join(self._component)
+        return ', '.join(self.component)
 
     @property
     def component(self):
-        return self._component
+        return self._raw.get(BugKeys.COMPONENT)
 
     @property
     def created(self):
-        return self._created
+        return self._raw.get(BugKeys.CREATED)
 
     @property
     def source(self):
-        return self._source
+        return self._raw.get(BugKeys.SOURCE)
 
     @property
     def states(self):
-        return self._states
+        return self._raw.get(BugKeys.STATES, {})
 
     @property
     def states_list(self):
-        summary = '\n'
-        for state_tuple in self._states:
-            summary += f"\t\t{state_tuple.actual:25} ({state_tuple.standard}):   {str(state_tuple.timestamp)}\n"
-        return summary
+        return '\n' + ''.join(f"\t\t{state_tuple.actual:25} ({state_tuple.standard}):   {str(state_tuple.timestamp)}\n"
+                              for state_tuple in self.states)
 
     @property
     def states_summary(self):
-        return self._states_summary
+        return self._raw.get(BugKeys.STATES_SUMMARY, [])
 
     @property
     def states_unique_summary(self):
-        reduced_unique = []
-        previous = None
-        for state in self._states_summary:
-            if state != previous:
-                reduced_unique.append(state)
-            previous = state
-        return reduced_unique
+        # Collapse consecutive duplicate states
+        return [state for state, _ in groupby(self.states_summary)]
 
     @property
     def is_valid(self):
-        return self._valid
+        return self._raw.get(BugKeys.VALID, True)
 
     @property
     def link(self):
-        return self._link
+        return self._raw.get(BugKeys.LINK)
 
     @property
     def assignee(self):
-        return self._assignee
+        return self._raw.get(BugKeys.ASSIGNEE)
 
     @property
     def reporter(self):
-        return self._reporter
+        return self._raw.get(BugKeys.REPORTER)
 
     @property
     def detected(self):
-        return self._detected
+        return self._raw.get(BugKeys.DETECTED)
 
     @property
     def fixed_in(self):
-        return self._fixed_in
+        return self._raw.get(BugKeys.FIXED_IN)
 
     @property
     def labels(self):
-        return self._labels
+        return self._raw.get(BugKeys.LABELS)
 
     @property
     def history(self):
-        return self._history
+        return self._raw.get(BugKeys.HISTORY, [])
 
 
 class Bugs(list):
 
     def __init__(self, bug_list: typing.List = None, mapping: ConfigFileType = None) -> typing.NoReturn:
-        super(Bugs, self).__init__()
+        super(Bugs, self).__init__(bug_list or ())
         self.mapping = mapping
-        if bug_list is not None:
-            for bug in bug_list:
-                self.append(bug)
 
     def add(self, bug: Bug) -> Bug:
         self.append(bug)
         return bug
 
+    def column(self, name: str) -> typing.List:
+        """
+        Get a single attribute across all bugs (e.g. - for bulk export or analysis of one field)
+
+        :param name: Name of the Bug attribute/property (see Bug.reportable_attributes)
+
+        :return: List of the attribute values, in the same order as the bugs
+
+        """
+        return list(map(operator.attrgetter(name), self))
+
     def validate(self, filename: str = None) -> typing.Dict:
         issues = {}
         for bug in self:
-            reporter = str(getattr(bug, BugKeys.REPORTER))
-            defect_link = str(getattr(bug, BugKeys.LINK))
-
-            for field in RequiredFields.REQUIRED:
-                field_value = getattr(bug, field, None)
-
-                # If required field is None or blank, log it!
-                if field_value is None or field_value == '':
 
-                    # Build out tracking dictionary as needed
-                    if reporter not in issues:
-                        issues[reporter] = OrderedDict()
-                    if defect_link not in issues[reporter]:
-                        issues[reporter][defect_link] = list()
+            # Find the required fields that are None or blank; most bugs have none, so stop there.
+            missing = [field for field, value in zip(RequiredFields.REQUIRED, _get_required_fields(bug))
+                       if value is None or value == '']
+            if not missing:
+                continue
 
-                    issues[reporter][defect_link].append(str(field))
+            # Record the missing fields by reporter and defect
+            reporter, defect_link = map(str, _get_reporter_and_link(bug))
+            issues.setdefault(reporter, OrderedDict()).setdefault(defect_link, []).extend(missing)
 
         # Write issues to file if requested
         if filename is not None and issues:
@@ -1,14 +1,30 @@
 #!/usr/bin/env python
 
-from collections import namedtuple
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import datetime
-import json
+import glob
+import gzip
+import hashlib
+import os
+import pickle
 import pprint
+import tempfile
+import threading
+import time
+from types import MappingProxyType
 import typing
-import urllib
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson parses the (bytes) responses several times faster than the stdlib; use it when it is installed.
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
 
 from defect_metrics.config.cfg_mappings import ConfigFileType
 from defect_metrics.defect_models.bug_model import Bug, Bugs, BugKeys
@@ -41,8 +57,66 @@ class DefectKeys:
     VALUE: str = 'VALUE'
 
 
-# Named tuple for tracking Jira state events
-State = namedtuple('State', 'actual, standard, timestamp')
+class State(typing.NamedTuple):
+    """ Jira state event: actual (Jira) state, normalized (standard) state, time of the transition """
+    actual: str
+    standard: str
+    timestamp: datetime.datetime
+
+
+# Length of the local time portion of a Jira timestamp: 'YYYY-MM-DDTHH:MM:SS.mmm'
+JIRA_TIMESTAMP_LEN = 23
+
+# Change log field name of status transitions
+_STATUS = JiraFields.STATUS.lower()
+_STATUS_LEN = len(_STATUS)
+
+
+def parse_jira_timestamp(timestamp: str) -> datetime.datetime:
+    """
+    Convert a Jira timestamp (e.g. - '2019-09-30T14:05:09.123+0000') to a datetime. The UTC offset is ignored.
+    (datetime.fromisoformat is implemented in C, and is much faster than strptime.)
+
+    :param timestamp: Jira timestamp string
+
+    :return: (datetime) Timestamp (naive; in the local time of the Jira server)
+
+    """
+    return datetime.datetime.fromisoformat(timestamp[:JIRA_TIMESTAMP_LEN])
+
+
+class RateLimiter:
+    """
+
+    Token bucket that limits the rate of requests; it can be shared by several clients (and their threads).
+    Up to `rate` requests can be made at once, after which requests are spaced 1/rate seconds apart.
+
+    """
+
+    def __init__(self, rate: float):
+        if not rate > 0:
+            raise ValueError(f"The request rate must be greater than zero: {rate}")
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> typing.NoReturn:
+        """
+        Wait until a request can be made.
+
+        :return: None
+
+        """
+        # Take a token (going into debt if there are none), then wait outside the lock until the debt is repaid.
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate) - 1
+            self._updated = now
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0
+        if wait:
+            time.sleep(wait)
 
 
 class JiraClient:
@@ -56,67 +130,529 @@ class JiraClient:
 
     CLIENT_TYPE = 'JIRA'
 
+    # Size of the HTTP connection pool (per host) shared by all requests made by the client
+    POOL_SIZE = 32
+
+    # Transient HTTP statuses (rate limited, server/gateway errors) that are retried with backoff (or after the
+    # delay given by the Retry-After header). The search is a POST, but it does not modify anything, so it is retried.
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    RETRY_METHODS = frozenset(['GET', 'POST'])
+
+    # Number of issues processed concurrently (processing may require fetching the issue's change log)
+    DEFAULT_CONCURRENCY = 16
+
+    # Number of issues requested per search call (Jira may cap this lower; see query())
+    DEFAULT_BATCH_SIZE = 500
+
+    # Number of search pages requested ahead of the page being processed (bounds the JSON held in memory)
+    PREFETCH_PAGES = 2
+
+    # Issue fields read by _decompose_bug_entry; the search only returns these fields. The description (often the
+    # largest field of an issue) is not used by the metrics, so it is not requested (Bug.description is None).
+    SEARCH_FIELDS = [
+        JiraFields.ASSIGNEE, JiraFields.COMPONENTS, JiraFields.CREATED, JiraFields.DETECTED, JiraFields.FIXED_VERSION,
+        JiraFields.LABELS, JiraFields.PRIORITY, JiraFields.PROJECT, JiraFields.REPORTER, JiraFields.SEVERITY,
+        JiraFields.STATUS, JiraFields.SUMMARY, JiraFields.UPDATED]
+
+    # Version of the cached Bug contents; increment when _decompose_bug_entry changes what it stores.
+    BUG_CACHE_VERSION = 2
+
+    # For values that are nested down a second layer in the JSON:
+    # data {ATTRIBUTE_NAME_1: {VALUE_NAME: value,
+    #                          some_other_attr: <whatever>, ... },
+    #       ATTRIBUTE_NAME_2: {VALUE_NAME: value,
+    #                          some_other_attr: <whatever>, ... },
+    #
+    # ------------------------------------------------------------
+    # DICTIONARY (COMPOUND_ATTRIBUTES)
+    # PRIMARY KEY: The name of the end attribute: VALUE_NAME
+    # LIST VALUES: List of the ATTRIBUTE_NAMES to retrieve
+    COMPOUND_ATTRIBUTES = {
+        DefectKeys.NAME: [DefectKeys.ASSIGNEE, DefectKeys.REPORTER, DefectKeys.PRIORITY, DefectKeys.STATUS],
+        DefectKeys.KEY: [DefectKeys.PROJECT],
+        DefectKeys.VALUE: [DefectKeys.SEVERITY, DefectKeys.DETECTED]
+    }
+
     def __init__(self, jira_url: str, mapping: ConfigFileType, pillar: str, username: str = None,
-                 pswd: str = None, date_range: typing.List[str] = None):
+                 pswd: str = None, date_range: typing.List[str] = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                 concurrency: int = DEFAULT_CONCURRENCY, cache_dir: str = None, cache_ttl: int = 0,
+                 rate_limiter: RateLimiter = None, session: requests.Session = None):
         self.url = jira_url
         self.auth = (username, pswd)
         self.mapping = mapping
         self.pillar = pillar
         self.date_range = date_range or []
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+
+        # Optional limit on the rate of requests to Jira (may be shared with other clients)
+        self.rate_limiter = rate_limiter
+
+        self.verb = JiraFields.UPDATED
+
+        # Optional on-disk cache of decomposed bugs: {defect_id: (updated timestamp, Bug)}; see _decompose_cached().
+        # Only the bugs returned during this client's lifetime are kept, and the cache is written by close().
+        self.cache_dir = cache_dir
+        self._bug_cache = None
+        self._bug_cache_seen = set()
+        self._bug_cache_updated = False
+        self._bug_cache_lock = threading.Lock()
+
+        # Results of a query are reused (without contacting Jira) for cache_ttl seconds; see query().
+        self.cache_ttl = cache_ttl
+
+        # Resolve the schema and status lookups used for every issue once, rather than per issue.
+        self._field_plan = self._build_field_plan()
+        # The pillar's (alternate state --> state) mapping is frozen with lower case keys and values, so every status
+        # (issue status or change log transition) is normalized with a single lookup.
+        pillar_mappings = self.mapping.mappings.get(self.pillar)
+        self._pillar_defined = pillar_mappings is not None
+        self._pillar_map = MappingProxyType(
+            {state.lower(): std_state.lower() for state, std_state in (pillar_mappings or {}).items()})
+        self._pillar_get = self._pillar_map.get
+
+        # Reuse connections (and TLS sessions) across all requests to Jira. A session provided by the caller (see
+        # create_session) may be shared with other clients, so it is left open by close().
+        self._owns_session = session is None
+        self._session = self.create_session(username=username, pswd=pswd) if session is None else session
+
+    @classmethod
+    def create_session(cls, username: str = None, pswd: str = None) -> requests.Session:
+        """
+        Create an HTTP session for Jira requests: pooled connections, retries of transient errors, and the login
+        credentials. The session can be shared by the clients of several pillars on the same Jira instance (the
+        connections and the Jira session cookie are then reused across the pillars).
+
+        :param username: Jira login username
+        :param pswd: Jira login password
+
+        :return: Configured requests.Session
+
+        """
+        session = requests.Session()
+        session.auth = (username, pswd)
+        adapter = HTTPAdapter(pool_connections=cls.POOL_SIZE, pool_maxsize=cls.POOL_SIZE,
+                              max_retries=Retry(total=5, backoff_factor=0.5, status_forcelist=cls.RETRY_STATUSES,
+                                                allowed_methods=cls.RETRY_METHODS, respect_retry_after_header=True,
+                                                raise_on_status=False))
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    def __enter__(self) -> "JiraClient":
+        return self
+
+    def __exit__(self, *exc_info) -> typing.NoReturn:
+        self.close()
+
+    def close(self) -> typing.NoReturn:
+        """
+        Write the bug cache (if caching is enabled), and close the client's HTTP session (and its pooled
+        connections), unless the session was provided by the caller.
+
+        :return: None
+
+        """
+        if self._bug_cache is not None:
+            self._save_bug_cache()
+        if self._owns_session:
+            self._session.close()
+
+    @staticmethod
+    def _quote(value: typing.Any) -> str:
+        """
+        Quote a value for use in a JQL clause
+
+        :param value: Value to quote
+
+        :return: (str) Double-quoted value, with embedded quotes and backslashes escaped
+
+        """
+        escaped = str(value).replace('\\', '\\\\').replace('"', '\\"')
+        return f'"{escaped}"'
+
+    def _build_field_plan(self) -> typing.List[typing.Tuple[str, str, str]]:
+        """
+        Resolve COMPOUND_ATTRIBUTES into the literal keys needed to extract each value from an issue.
+
+        :return: List of tuples: (Bug attribute, Jira parent field, Jira value field)
+
+        """
+        plan = []
+        for data_field, parent_attr_list in self.COMPOUND_ATTRIBUTES.items():
+            value_attr = getattr(JiraFields, data_field)
+            for attr_name in parent_attr_list:
+                plan.append((str(getattr(BugKeys, attr_name)), str(getattr(JiraFields, attr_name)), value_attr))
+        return plan
+
+    def _build_jql(self, query_params_dict: typing.Dict, jql_clauses: typing.List[str] = None) -> str:
+        """
+        Build the JQL for a query: the parameters and clauses are AND'd, plus the date range (if one is defined).
+
+        :param query_params_dict: Dictionary of parameters (field: value) to be used to build the JQL query
+        :param jql_clauses: Additional JQL clauses (used as-is)
+
+        :return: (str) JQL
+
+        """
+        # Values are quoted (so values with spaces or reserved words are valid JQL)
+        clauses = [f'{key} = {self._quote(value)}' for key, value in query_params_dict.items()]
 
-        self.verb = "updated"
+        # Add date range, if defined (the client defaults to an empty date range).
+        if len(self.date_range) == 2:
+            clauses.append(f'{self.verb} >= "{self.date_range[0]}" AND {self.verb} <= "{self.date_range[1]}"')
+        clauses.extend(jql_clauses or [])
+        return ' AND '.join(clauses)
 
-    def query(self, query_params_dict: typing.Dict) -> Bugs:
+    def query(self, query_params_dict: typing.Dict, jql_clauses: typing.List[str] = None) -> Bugs:
         """
-        Makes a request to the specified Jira instance.
+        Makes a request to the specified Jira instance (see _search). If caching is enabled (cache_dir and
+        cache_ttl), the results of an identical query made within the last cache_ttl seconds are reused.
 
         :param query_params_dict: Dictionary of parameters (AND'D) to be used to build the JQL query
+        :param jql_clauses: Additional JQL clauses (AND'D; used as-is)
 
         :return: A list of populated Bug objects - 1 Bug object per record returned.
 
         """
+        return self._query_jql(self._build_jql(query_params_dict, jql_clauses))[0]
 
-        # Crate the list to populate
-        defects = Bugs(mapping=self.mapping)
+    def query_projects(self, projects: typing.List[str], query_params_dict: typing.Dict,
+                       jql_clauses: typing.List[str] = None) -> typing.Optional[typing.Dict[str, Bugs]]:
+        """
+        Query several projects with a single search ('project in (...)'), and group the results by project.
 
-        params = 'AND'.join([" {} = {} ".format(k, v) for k, v in query_params_dict.items()])
+        :param projects: List of Jira project keys
+        :param query_params_dict: Dictionary of additional parameters (AND'D) to be used to build the JQL query
+        :param jql_clauses: Additional JQL clauses (AND'D; used as-is)
 
-        # Add date range, if defined.
-        if self.date_range is not None:
-            dates = f'{self.verb} >= "{self.date_range[0]}" AND {self.verb} <= "{self.date_range[1]}"'
-            params += f"AND {dates} "
+        :return: Dictionary of project --> list of populated Bug objects (in the order of the search results), or
+                 None if the search failed (e.g. - one of the projects does not exist) or a returned issue does not
+                 match any of the project keys (e.g. - a project was listed by name rather than by key), in which
+                 case the projects need to be queried separately.
 
-        params = urllib.parse.quote_plus(params)
+        """
+        projects_clause = f"{JiraFields.PROJECT} in ({', '.join(map(self._quote, projects))})"
+        jql = ' AND '.join(filter(None, [projects_clause, self._build_jql(query_params_dict, jql_clauses)]))
+
+        # Project keys are upper case; the configured projects may not be.
+        defects, complete = self._query_jql(jql)
+        if not complete:
+            logging.warn(f"The search for projects {projects} failed; querying the projects separately.")
+            return None
+
+        by_key = {project.upper(): Bugs(mapping=self.mapping) for project in projects}
+        for defect in defects:
+            project_bugs = by_key.get(str(defect.project).upper())
+            if project_bugs is None:
+                logging.debug(f"{defect.defect_id}: project '{defect.project}' is not one of: {projects}")
+                return None
+            project_bugs.append(defect)
+
+        return {project: by_key[project.upper()] for project in projects}
+
+    def _query_jql(self, jql: str) -> typing.Tuple[Bugs, bool]:
+        """
+        Makes a request to the specified Jira instance (see _search), using the cached results if possible.
 
-        # Build the JQL URL
-        url = f'{self.url}/rest/api/2/search?jql={params}'
-        logging.debug(f"DEBUG: URL: {url}")
+        :param jql: JQL of the query
 
-        # Make the request
-        response = requests.get(url=url, auth=self.auth)
-        if response.status_code == requests.codes.ok:
-            issues = self._deserialize_content(response.content, key=JiraFields.ISSUES)
+        :return: Tuple of (list of populated Bug objects - 1 Bug object per record returned,
+                           True if all pages were retrieved)
 
-            # logging.debug(f"\n{pprint.pformat(issues)}")
-            logging.debug(f"NUM ISSUES: {len(issues)}")
+        """
+        cache_file = None
+        if self.cache_dir is not None and self.cache_ttl > 0:
+            cache_file = self._query_cache_file(jql)
+            defects = self._load_query_cache(cache_file)
+            if defects is not None:
+                logging.debug(f"Using cached results for JQL: {jql}")
+                with self._bug_cache_lock:
+                    self._bug_cache_seen.update(defect.defect_id for defect in defects)
+                return defects, True
 
-            # For each issue returned, deserialize into a Bug object
-            for issue in issues:
-                defect_obj = self._decompose_bug_entry(bug_entry=issue)
-                defects.append(defect_obj)
+        defects, complete = self._search(jql)
 
-        else:
-            logging.error(f'ERROR: Response Code = "{response.status_code}" for URL: {url}')
+        # Only cache complete results (not those of a query that failed part way through).
+        if cache_file is not None and complete:
+            self._save_query_cache(cache_file, defects)
+
+        return defects, complete
+
+    def _search(self, jql: str) -> typing.Tuple[Bugs, bool]:
+        """
+        Search the specified Jira instance, and collect the results of all pages (see _iter_pages).
+
+        :param jql: JQL of the search
+
+        :return: Tuple of (list of populated Bug objects - 1 Bug object per record returned,
+                           True if all pages were retrieved)
+
+        """
+        defects = Bugs(mapping=self.mapping)
+        for bugs in self._iter_pages(jql):
+            if bugs is None:
+                return defects, False
+            defects.extend(bugs)
+        return defects, True
+
+    def _iter_pages(self, jql: str) -> typing.Iterator[typing.Optional[typing.List[Bug]]]:
+        """
+        Search the specified Jira instance. Results are requested in pages of `batch_size`
+        issues until all matching issues have been retrieved.
+
+        :param jql: JQL of the search
+
+        :return: Iterator of the populated Bug objects of each page, in order; None if a page could not be
+                 retrieved (no further pages are returned).
+
+        """
+        url = f'{self.url}/rest/api/2/search'
+        body = {JiraFields.JQL: jql,
+                JiraFields.START_AT: 0,
+                JiraFields.MAX_RESULTS: self.batch_size,
+                JiraFields.FIELDS: self.SEARCH_FIELDS,
+                DefectKeys.EXPAND: [DefectKeys.CHANGELOG]}
+        logging.debug(f"DEBUG: URL: {url}  JQL: {jql}")
+
+        # Reuse the bugs that have not been updated since they were cached (if caching is enabled).
+        decompose = self._decompose_bug_entry
+        if self.cache_dir is not None:
+            with self._bug_cache_lock:
+                if self._bug_cache is None:
+                    self._bug_cache = self._load_bug_cache()
+            decompose = self._decompose_cached
+
+        # The first page reports the total number of matching issues. The remaining pages are then requested (by
+        # offset) up to PREFETCH_PAGES ahead, on their own threads, while the issues of the current page are
+        # processed in the thread pool, so the downloads overlap the parsing without every page being held in
+        # memory. Pages are consumed in offset order, so the order of the issues is preserved.
+        with ThreadPoolExecutor(max_workers=self.PREFETCH_PAGES) as fetcher, \
+                ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            page = self._search_page(url, body)
+            if page is None:
+                yield None
+                return
+            issues = page.get(JiraFields.ISSUES, [])
+            logging.debug(f"NUM ISSUES: {len(issues)} (startAt: 0, total: {page.get(JiraFields.TOTAL, 0)})")
+
+            # Jira caps maxResults (jira.search.views.default.max); if so, use the server's page size.
+            page_size = page.get(JiraFields.MAX_RESULTS, self.batch_size)
+            if page_size < self.batch_size:
+                logging.warn(f"Jira limited the page size to {page_size} (requested {self.batch_size}).")
+
+            offsets = iter(range(len(issues), page.get(JiraFields.TOTAL, 0), page_size) if issues else ())
+            pages = deque()
+
+            def request_next_page() -> None:
+                offset = next(offsets, None)
+                if offset is not None:
+                    pages.append((offset, fetcher.submit(self._search_page, url, {
+                        **body, JiraFields.START_AT: offset, JiraFields.MAX_RESULTS: page_size})))
+
+            for _ in range(self.PREFETCH_PAGES):
+                request_next_page()
+
+            # For each issue returned, deserialize into a Bug object. Each page is released once processed.
+            while True:
+                yield list(executor.map(decompose, issues))
+                if not pages:
+                    break
+                offset, next_page = pages.popleft()
+                page = next_page.result()
+                if page is None:
+                    yield None
+                    return
+                request_next_page()
+                issues = page.get(JiraFields.ISSUES, [])
+                logging.debug(f"NUM ISSUES: {len(issues)} (startAt: {offset})")
+
+    def _search_page(self, url: str, body: typing.Dict) -> typing.Optional[typing.Dict]:
+        """
+        Requests a single page of search results.
+
+        :param url: URL of the Jira search endpoint
+        :param body: JSON body of the search request (JQL, startAt, maxResults, ...)
+
+        :return: Deserialized page of results, or None if the request failed.
+
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        try:
+            response = self._session.post(url=url, json=body)
+        except requests.RequestException as err:
+            logging.error(f'ERROR: Request failed for URL: {url}  JQL: {body[JiraFields.JQL]}\n\t{err}')
+            return None
+        if response.status_code != requests.codes.ok:
+            logging.error(f'ERROR: Response Code = "{response.status_code}" for URL: {url}  '
+                          f'JQL: {body[JiraFields.JQL]}')
             logging.error(f'\nURL Response:\n\t{response.content}\n')
+            return None
+        return self._deserialize_content(response.content)
+
+    def _bug_cache_file(self) -> str:
+        """
+        Get the path of the bug cache: bugs.<instance and pillar>.<contents>.pkl. The contents part includes the
+        mapping file's modification time, so changing the state mappings (which determine the normalized states
+        stored in each Bug) starts a new cache; the superseded file is removed by _save_bug_cache().
+
+        :return: (str) Path of the bug cache file
+
+        """
+        try:
+            mtime = os.stat(self.mapping.file).st_mtime_ns
+        except OSError:
+            mtime = 0
+        key = hashlib.blake2b(f"{self.BUG_CACHE_VERSION}:{os.path.abspath(self.mapping.file)}:{mtime}".encode(),
+                              digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, f"{self._bug_cache_prefix()}.{key}.pkl")
+
+    def _bug_cache_prefix(self) -> str:
+        """
+        Get the part of the bug cache file name that identifies the Jira instance and pillar (see _bug_cache_file).
+
+        :return: (str) File name prefix
+
+        """
+        return f"bugs.{hashlib.blake2b(f'{self.url}:{self.pillar}'.encode(), digest_size=16).hexdigest()}"
 
-        return defects
+    def _load_bug_cache(self) -> typing.Dict[str, typing.Tuple[str, Bug]]:
+        """
+        Load the bugs cached by a previous run.
+
+        :return: Dictionary of {defect_id: (updated timestamp, Bug)}; empty if there is no (readable) cache.
+
+        """
+        try:
+            with open(self._bug_cache_file(), "rb") as CACHE:
+                return pickle.load(CACHE)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as err:
+            logging.debug(f"No bug cache loaded: {err}")
+            return {}
+
+    def _save_bug_cache(self) -> None:
+        """
+        Write the bug cache (to a temp file that is renamed, so a concurrent reader never sees a partial pickle).
+        Only the bugs returned during this client's lifetime are kept, so the cache does not grow beyond the
+        pillar's query results. Cache files of the same Jira instance and pillar that have been superseded (e.g.
+        - by a change to the mapping file) are removed.
+
+        :return: None
+
+        """
+        with self._bug_cache_lock:
+            bugs = {defect_id: entry for defect_id, entry in self._bug_cache.items()
+                    if defect_id in self._bug_cache_seen}
+            if not self._bug_cache_updated and len(bugs) == len(self._bug_cache):
+                return
+
+            cache_file = self._bug_cache_file()
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                fd, tmp_file = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+                with os.fdopen(fd, "wb") as CACHE:
+                    pickle.dump(bugs, CACHE, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp_file, cache_file)
+            except OSError as err:
+                logging.warn(f"Unable to write the bug cache to '{self.cache_dir}': {err}")
+                return
+
+            self._bug_cache = bugs
+            self._bug_cache_updated = False
+            for stale_file in glob.glob(os.path.join(self.cache_dir, f"{self._bug_cache_prefix()}.*.pkl")):
+                if stale_file != cache_file:
+                    try:
+                        os.remove(stale_file)
+                    except OSError as err:
+                        logging.debug(f"Unable to remove the superseded bug cache '{stale_file}': {err}")
+
+    def _query_cache_file(self, jql: str) -> str:
+        """
+        Get the path of the cached results of a query. The key includes everything that determines the
+        results: the Jira instance, the JQL (projects, dates, ...), the requested fields and the state mappings.
+
+        :param jql: JQL of the query
+
+        :return: (str) Path of the query's cache file
+
+        """
+        try:
+            mtime = os.stat(self.mapping.file).st_mtime_ns
+        except OSError:
+            mtime = 0
+        key = hashlib.blake2b(f"{self.BUG_CACHE_VERSION}:{self.url}:{jql}:{','.join(self.SEARCH_FIELDS)}:"
+                              f"{os.path.abspath(self.mapping.file)}:{mtime}".encode(), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, self.pillar, f"query.{key}.pkl.gz")
+
+    def _load_query_cache(self, cache_file: str) -> typing.Optional[Bugs]:
+        """
+        Load the cached results of a query, if they are less than cache_ttl seconds old.
+
+        :param cache_file: Path of the query's cache file (see _query_cache_file)
+
+        :return: List of populated Bug objects, or None if there are no (recent, readable) cached results.
+
+        """
+        try:
+            if os.stat(cache_file).st_mtime < time.time() - self.cache_ttl:
+                return None
+            with gzip.open(cache_file, "rb") as CACHE:
+                return Bugs(bug_list=pickle.load(CACHE), mapping=self.mapping)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as err:
+            logging.debug(f"No cached query results loaded: {err}")
+            return None
+
+    def _save_query_cache(self, cache_file: str, defects: Bugs) -> None:
+        """
+        Write the results of a query (to a temp file that is renamed, so a reader never sees a partial file).
+
+        :param cache_file: Path of the query's cache file (see _query_cache_file)
+        :param defects: List of populated Bug objects
+
+        :return: None
+
+        """
+        cache_dir = os.path.dirname(cache_file)
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            fd, tmp_file = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+            with os.fdopen(fd, "wb") as RAW, gzip.GzipFile(fileobj=RAW, mode="wb") as CACHE:
+                pickle.dump(list(defects), CACHE, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file, cache_file)
+        except OSError as err:
+            logging.warn(f"Unable to write the query results to '{cache_dir}': {err}")
+
+    def _decompose_cached(self, bug_entry: typing.Dict) -> Bug:
+        """
+        Get the Bug for the issue from the bug cache if the issue has not been updated since it was cached;
+        otherwise decompose the issue and cache the result.
+
+        :param bug_entry: Data (from _deserialize_content)
+
+        :return: Instantiated, populated Defect obj
+
+        """
+        defect_id = bug_entry.get(JiraFields.DEFECT_ID)
+        updated = (bug_entry.get(JiraFields.FIELDS) or {}).get(JiraFields.UPDATED)
+
+        self._bug_cache_seen.add(defect_id)
+        cached = self._bug_cache.get(defect_id)
+        if updated is not None and cached is not None and cached[0] == updated:
+            return cached[1]
+
+        defect = self._decompose_bug_entry(bug_entry)
+        if updated is not None:
+            self._bug_cache[defect_id] = (updated, defect)
+            self._bug_cache_updated = True
+        return defect
 
     @staticmethod
-    def _deserialize_content(content: typing.Dict, key: str = '') -> typing.Dict:
+    def _deserialize_content(content: bytes, key: str = '') -> typing.Dict:
         """
         Process the responses returned from Jira (convert from JSON into Python structure)
 
-        :param content: Raw responses from JIRA
+        :param content: Raw responses from JIRA (bytes)
         :param key: String key if JSON data has primary level key.
 
         :return: (Dict) Python data structure that matches JSON data
@@ -124,7 +660,7 @@ class JiraClient:
         """
         deserialized_content = None
         try:
-            json_resp = json.loads(content)
+            json_resp = json_loads(content)
         except Exception as err:
             logging.error(f"ERROR: Unable to decode json:\n{err}")
         else:
@@ -150,7 +686,6 @@ class JiraClient:
         bug_fields = bug_entry.get(JiraFields.FIELDS)
 
         defect_id = str(bug_entry.get(JiraFields.DEFECT_ID))
-        project = defect_id.split('-')[0].lower()
 
         # Store basic defect information
         bug_data[BugKeys.PILLAR] = self.pillar
@@ -164,78 +699,43 @@ class JiraClient:
         bug_data[BugKeys.LINK] = web_url_fmt.format(**link_args)
 
         # Get Created timestamp
-        bug_data[BugKeys.CREATED] = datetime.datetime.strptime(
-            (str(bug_fields.get(JiraFields.CREATED)).split('+'))[0], '%Y-%m-%dT%H:%M:%S.%f')
-
-        # For values that are nested down a second layer in the JSON:
-        # data {ATTRIBUTE_NAME_1: {VALUE_NAME: value,
-        #                          some_other_attr: <whatever>, ... },
-        #       ATTRIBUTE_NAME_2: {VALUE_NAME: value,
-        #                          some_other_attr: <whatever>, ... },
-        #
-        # ------------------------------------------------------------
-        # DICTIONARY (compound_attributes)
-        # PRIMARY KEY: The name of the end attribute: VALUE_NAME
-        # LIST VALUES: List of the ATTRIBUTE_NAMES to retrieve
-
-        compound_attributes = {
-            DefectKeys.NAME: [DefectKeys.ASSIGNEE, DefectKeys.REPORTER, DefectKeys.PRIORITY, DefectKeys.STATUS],
-            DefectKeys.KEY: [DefectKeys.PROJECT],
-            DefectKeys.VALUE: [DefectKeys.SEVERITY, DefectKeys.DETECTED]
-        }
-
-        logging.debug(f"Pillar: {self.pillar}")
-        logging.debug(f"Project: {project.upper()}")
-        logging.debug(f"Defect ID: {defect_id}")
-
-        # logging.debug(f"\n{pprint.pformat(self.mapping.mappings)}")
-        # logging.debug(f"Bug Fields\n{pprint.pformat(bug_fields)}")
-
-        # Get the data defined in the compound_attributes dictionary, based on expected key in the JSON
-        for data_field, parent_attr_list in compound_attributes.items():
-
-            # For each expected key in the nested JSON
-            for attr_name in parent_attr_list:
-
-                # Get the keywords required to pull the data
-                attr_name = str(attr_name)
-                defect_attr = str(getattr(BugKeys, attr_name))
-                parent_attr = str(getattr(JiraFields, attr_name))
-                value_attr = getattr(JiraFields, data_field)
-
-                # Try to extract the data
-                try:
-                    bug_data[defect_attr] = bug_fields[parent_attr][value_attr]
-                except (KeyError, TypeError):
-                    bug_data[defect_attr] = None
-                    logging.warn(f"{defect_id} --> Did not find: {defect_attr}")
-                else:
-
-                    # Translate status to accepted QE statuses...
-                    if attr_name == DefectKeys.STATUS:
-                        mapping = self.mapping.mappings[self.pillar]
-                        try:
-                            bug_data[defect_attr] = mapping[str(bug_data[defect_attr]).lower()].lower()
-                        except KeyError:
-                            logging.error(
-                                f"{defect_id} --> Unrecognized Defect Status: '{bug_data[defect_attr].lower()}'. "
-                                f"Need to add and classify the defect.")
-                            continue
-
-        # Process the fields that contain lists
-        comp_list_fields = bug_fields.get(JiraFields.COMPONENTS)
-        bug_data[BugKeys.COMPONENT] = [str(comp.get(JiraFields.NAME)) for comp in comp_list_fields]
-
-        fixed_ver_list = bug_fields[JiraFields.FIXED_VERSION]
-        bug_data[BugKeys.FIXED_IN] = [str(ver.get(JiraFields.NAME)) for ver in fixed_ver_list]
-
-        bug_data[BugKeys.LABELS] = [str(lbl) for lbl in bug_fields[JiraFields.LABELS]]
-
-        # Scrape change_log for history of defect state changes
-        change_log = self._get_change_log(bug_data[BugKeys.DEFECT_ID])
-
-        # Store the change log
-        bug_data[BugKeys.ITEMS] = change_log
+        bug_data[BugKeys.CREATED] = parse_jira_timestamp(str(bug_fields.get(JiraFields.CREATED)))
+
+        if logging.is_debug():
+            logging.debug(f"Pillar: {self.pillar}")
+            logging.debug(f"Project: {defect_id.split('-')[0].upper()}")
+            logging.debug(f"Defect ID: {defect_id}")
+
+        # Get the data defined in the COMPOUND_ATTRIBUTES dictionary (resolved into self._field_plan)
+        for defect_attr, parent_attr, value_attr in self._field_plan:
+            try:
+                bug_data[defect_attr] = bug_fields[parent_attr][value_attr]
+            except (KeyError, TypeError):
+                bug_data[defect_attr] = None
+                logging.warn(f"{defect_id} --> Did not find: {defect_attr}")
+
+        # Translate status to accepted QE statuses...
+        if bug_data[BugKeys.STATUS] is not None:
+            status = str(bug_data[BugKeys.STATUS]).lower()
+            std_status = self._pillar_get(status)
+            if std_status is not None:
+                bug_data[BugKeys.STATUS] = std_status
+            else:
+                logging.error(f"{defect_id} --> Unrecognized Defect Status: '{status}'. "
+                              f"Need to add and classify the defect.")
+
+        # Process the fields that contain lists (only the name of each entry is kept).
+        # Jira omits or nulls these fields when the issue has no entries, so treat both as empty.
+        bug_data[BugKeys.COMPONENT] = [
+            str(comp.get(JiraFields.NAME)) for comp in bug_fields.get(JiraFields.COMPONENTS) or []]
+        bug_data[BugKeys.FIXED_IN] = [
+            str(ver.get(JiraFields.NAME)) for ver in bug_fields.get(JiraFields.FIXED_VERSION) or []]
+        bug_data[BugKeys.LABELS] = [str(lbl) for lbl in bug_fields.get(JiraFields.LABELS) or []]
+
+        # The search expands the change log inline; only fetch it separately if it is missing or truncated.
+        change_log = bug_entry
+        if not self._has_full_change_log(bug_entry):
+            change_log = self._get_change_log(bug_data[BugKeys.DEFECT_ID])
 
         # Get the status transition history, the normalized status, and the basic workflow (state_summary)
         transition_data, states, normalized_states = self._parse_change_log(
@@ -247,7 +747,8 @@ class JiraClient:
 
         # Build the Bug object
         defect = Bug(**bug_data)
-        logging.info(f"DEFECT {defect.defect_id}:\n{str(defect)}\n")
+        if logging.is_enabled_for(logger.Logger.INFO):
+            logging.info(f"DEFECT {defect.defect_id}:\n{str(defect)}\n")
 
         return defect
 
@@ -266,9 +767,6 @@ class JiraClient:
         transitions = bug_data[BugKeys.STATES]
         states = [x.lower() for x in transitions.keys()]
 
-        # logging.debug(f"Transitions: {pprint.pformat(transitions)}")
-        # logging.debug(f"DEFINED STATES: {', '.join(states)}")
-
         # Check if it is the 'NEW' state. If so, open (states[1]) will be None
         update_status = transitions[states[1]] is None
         for state in states[2:]:
@@ -276,18 +774,40 @@ class JiraClient:
         if update_status:
             bug_data[BugKeys.STATUS] = str(states[0]).lower()
 
+    @staticmethod
+    def _has_full_change_log(bug_entry: typing.Dict) -> bool:
+        """
+        Check if the issue (from the search results) contains its complete change log
+
+        :param bug_entry: Issue data (from _deserialize_content)
+
+        :return: True if all change log histories are present
+
+        """
+        change_log = bug_entry.get(JiraFields.CHANGE_LOG)
+        if not change_log or change_log.get(JiraFields.HISTORIES) is None:
+            return False
+        return len(change_log[JiraFields.HISTORIES]) >= change_log.get(JiraFields.TOTAL, 0)
+
     def _get_change_log(self, defect_id: str) -> typing.Dict:
         """
         Get the defect's change log (this requires an additional query to Jira)
 
         :param defect_id: ID of the defect
 
-        :return: Deserialized JSON data structure (dict)
+        :return: Deserialized JSON data structure (dict), or None if the request failed
 
         """
+        # Only the change log is used, so do not request the (potentially large) issue fields.
         url = f'{self.url}/rest/api/2/issue/{defect_id}'
-        params = {DefectKeys.EXPAND: DefectKeys.CHANGELOG}
-        response = requests.get(url=url, params=params, auth=self.auth)
+        params = {DefectKeys.EXPAND: DefectKeys.CHANGELOG, JiraFields.FIELDS: JiraFields.STATUS}
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        try:
+            response = self._session.get(url=url, params=params)
+        except requests.RequestException as err:
+            logging.error(f'ERROR: Unable to get the change log of {defect_id}: {err}')
+            return None
         return self._deserialize_content(content=response.content)
 
     def _parse_change_log(self, change_log_json: typing.Dict, defect_id: str, create_time: datetime.datetime) -> \
@@ -307,9 +827,11 @@ class JiraClient:
 
         """
         # Define state change list and add the "new" or created state since that is not in the change log history)
-        state_changes = [State(actual=self.mapping.order[0],
-                               standard=self.mapping.order[0],
-                               timestamp=create_time)]
+        # The actual and normalized state lists are built alongside it, in the same pass over the change log.
+        initial_state = self.mapping.order[0]
+        state_changes = [State(initial_state, initial_state, create_time)]
+        actual_states = [initial_state]
+        normalized_states = [self._pillar_get(initial_state.lower())]
 
         try:
             chg_logs = change_log_json[JiraFields.CHANGE_LOG][JiraFields.HISTORIES]
@@ -317,7 +839,7 @@ class JiraClient:
         except (KeyError, TypeError) as err:
             logging.error(f"Exception Thrown for {defect_id}: {err}")
             logging.error(f"ERROR: Unable to get the ChangeLog:\n{pprint.pformat(change_log_json)}")
-            return state_changes, [st.actual for st in state_changes], self._normalize_states(state_changes)
+            return state_changes, actual_states, normalized_states
 
         for chg in chg_logs:
 
@@ -327,48 +849,38 @@ class JiraClient:
             # Check each log transaction
             for item in chg_item_list:
 
-                # If the field is a status field, this record will contain a status change.
-                if item[JiraFields.FIELD].lower() == JiraFields.STATUS.lower():
+                # If the field is a status field, this record will contain a status change. Jira reports the field
+                # in lower case, and most items are other fields, so only lower the name when it could match.
+                field = item[JiraFields.FIELD]
+                if field == _STATUS or (len(field) == _STATUS_LEN and field.lower() == _STATUS):
 
                     # Get the original "change to" data
                     orig_chg_to = str(item[JiraFields.CHG_TO]).lower()
 
                     # If the pillar is not defined in the mappings, throw an error
-                    if self.mapping.mappings.get(self.pillar, None) is None:
+                    if not self._pillar_defined:
                         err = "ERROR: Pillar '{pillar}' is not defined in the mappings file: {file}"
                         logging.error(err.format(pillar=self.pillar, file=self.mapping.file))
-                        return (state_changes,
-                                [st.actual for st in state_changes],
-                                self._normalize_states(state_changes))
+                        return state_changes, actual_states, normalized_states
 
-                    # If the state is not defined in the mappings file, raise a warning and keep going
-                    if orig_chg_to not in self.mapping.mappings[self.pillar]:
+                    # Convert the original state to a normalized (standard) state. If the state is not defined in
+                    # the mappings file, raise a warning and keep going
+                    std_chg_to = self._pillar_get(orig_chg_to)
+                    if std_chg_to is None:
                         logging.warn(f"{defect_id}: Ignoring state change: {orig_chg_to}")
                         logging.warn(f"{chg}")
                         continue
 
-                    # Covert the original state to a normalized (standard) change
-                    std_chg_to = self.mapping.mappings[self.pillar][orig_chg_to]
-                    chg_time = datetime.datetime.strptime(
-                        str(chg[JiraFields.CREATED]).split('+')[0], '%Y-%m-%dT%H:%M:%S.%f')
-
-                    state_changes.append(
-                        State(actual=orig_chg_to, standard=std_chg_to, timestamp=chg_time))
+                    chg_time = parse_jira_timestamp(str(chg[JiraFields.CREATED]))
 
-        logging.debug(f"Change Log Timing Tuples: {pprint.pformat(state_changes)}")
+                    state_changes.append(State(orig_chg_to, std_chg_to, chg_time))
+                    actual_states.append(orig_chg_to)
+                    normalized_states.append(std_chg_to)
 
-        return state_changes, [st.actual for st in state_changes], self._normalize_states(state_changes)
+        if logging.is_debug():
+            logging.debug(f"Change Log Timing Tuples: {pprint.pformat(state_changes)}")
 
-    def _normalize_states(self, state_list: typing.List[State]) -> typing.List[str]:
-        """
-        Convert states to consistent set of states (e.g. - in development = open, in uat = test, etc.)
-        :param state_list: List of State tuples
-
-        :return: (List[str]) List of normalized states
-
-        """
-        rev_mapping = self.mapping.get_reverse_status_mappings()
-        return [rev_mapping.get(state.actual) for state in state_list]
+        return state_changes, actual_states, normalized_states
 
     def _validate_dates(self, change_dates: typing.Dict[str, datetime.datetime]) -> typing.NoReturn:
         """
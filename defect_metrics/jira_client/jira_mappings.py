@@ -61,13 +61,18 @@ class JiraFields(object):
     ISSUES: str = 'issues'
     ISSUETYPE: str = 'issuetype'
     ITEMS: str = 'items'
+    JQL: str = 'jql'
     LABELS: str = 'labels'
     LINK: str = 'self'
+    MAX_RESULTS: str = 'maxResults'
     NAME: str = 'name'
     PRIORITY: str = 'priority'
     PROJECT: str = 'project'
     REPORTER: str = 'creator'
     SEVERITY: str = 'customfield_13654'
+    START_AT: str = 'startAt'
     STATUS: str = 'status'
     SUMMARY: str = 'summary'
+    TOTAL: str = 'total'
+    UPDATED: str = 'updated'
     VALUE: str = 'value'
@@ -22,23 +22,68 @@
       * FILENAME, ROUTINE, and LINE NUMBER of invoking code
 
 """
+import atexit
 import inspect
 import logging
+from logging.handlers import QueueHandler, QueueListener
 import os
-from typing import List, Optional
+import queue
+import sys
+import threading
+from typing import Dict, List, Optional, Tuple
 
 import prettytable
 
 
 # TODO: <DOC> Add README.md to directory
 
+# The PID only changes in a forked child, so look it up once (and again after a fork) instead of per log record.
+_PID = os.getpid()
+
+
+def _reset_pid() -> None:
+    global _PID
+    _PID = os.getpid()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reset_pid)
+
+# Writes the records queued by the root logger to the actual handlers; see Logger._start_listener()
+_LISTENER: Optional[QueueListener] = None
+
+# Per-thread dictionary of the calling context passed as 'extra' to each record; see Logger._method()
+_EXTRA = threading.local()
+
+# Dotted module path of each (source file, project); see ContextAdapter._module_path()
+_FILE_CACHE: Dict[Tuple[str, Optional[str]], str] = {}
+
+# sys._getframe(depth) returns the caller's frame without building the FrameInfo (source lines, etc.) of the whole
+# stack like inspect.stack() does. It is CPython specific, so fall back to walking back from inspect.currentframe().
+try:
+    _getframe = sys._getframe
+except AttributeError:  # pragma: no cover
+    def _getframe(depth: int = 0):
+        frame = inspect.currentframe().f_back
+        for _ in range(depth):
+            frame = frame.f_back
+        return frame
+
+
 class ContextAdapter(logging.LoggerAdapter):
 
     PROJECT = 'site-packages'
 
+    def __init__(self, logger, extra):
+        super(ContextAdapter, self).__init__(logger, extra)
+
+        # Defaults for every record (a record can override them with the 'depth' and 'project' kwargs)
+        self._depth = extra['depth']
+        self._project = extra['project']
+
     def process(self, msg, kwargs):
-        depth = kwargs.pop('depth', self.extra['depth']) + 3
-        project = kwargs.pop('project', self.extra['project'])
+        depth = (kwargs.pop('depth') if 'depth' in kwargs else self._depth) + 3
+        project = kwargs.pop('project') if 'project' in kwargs else self._project
         filename, line_num, routine, pid = self._method(depth, project)
         cntxt_msg = f'[{pid}][{filename}:{routine}|{line_num}] - {str(msg)}'
 
@@ -68,17 +113,31 @@ class ContextAdapter(logging.LoggerAdapter):
         :return: Tuple of values listed above.
 
         """
-        frame_info = inspect.stack()[depth]
+        frame = _getframe(depth)
+        code = frame.f_code
+        return self._module_path(code.co_filename, project), frame.f_lineno, code.co_name, _PID
 
-        filename = str(os.path.abspath(frame_info[1]))
-        if project is None or project not in filename:
-            project = self.PROJECT
-        filename = filename.split(f'{project}{os.path.sep}')[-1]
+    @classmethod
+    def _module_path(cls, filename: str, project: Optional[str]) -> str:
+        """
+        Get the dotted module path of a source file, relative to the project (or site-packages).
+        Every log record from the same file has the same path, so the result is cached per (file, project).
 
-        filename = self._translate_to_dotted_lib_path(path=filename)
-        line_num = frame_info[2]
-        routine = frame_info[3]
-        return filename, line_num, routine, os.getpid()
+        :param filename: Source file (code object's co_filename)
+        :param project: Name of project
+
+        :return: (str) dotted module path
+
+        """
+        key = (filename, project)
+        path = _FILE_CACHE.get(key)
+        if path is None:
+            path = str(os.path.abspath(filename))
+            if project is None or project not in path:
+                project = cls.PROJECT
+            path = _FILE_CACHE[key] = cls._translate_to_dotted_lib_path(
+                path=path.split(f'{project}{os.path.sep}')[-1])
+        return path
 
 
 class Logger:
@@ -127,6 +186,15 @@ class Logger:
     # e.g. = 40 --> INFO
     VAL_TO_STR = {value: text for text, value in STR_TO_VAL.items()}
 
+    # Level name (as passed to _log_level) --> (ContextAdapter method, logging.LEVEL). WARN uses warning():
+    # the adapter's deprecated warn() adds a stack level, which offsets the reported calling routine.
+    LEVEL_ROUTINES = {'CRITICAL': ('critical', CRITICAL),
+                      'ERROR': ('error', ERROR),
+                      'WARN': ('warning', WARN),
+                      'INFO': ('info', INFO),
+                      'DEBUG': ('debug', DEBUG),
+                      'EXCEPTION': ('exception', ERROR)}
+
     # Logging statement format
     LOG_FORMAT = r'[%(asctime)-15s] - [%(levelname)s] - %(message)s'
     DATE_FORMAT = r'%m%d%y-%T'
@@ -138,6 +206,30 @@ class Logger:
     DEFAULT_STACK_DEPTH = 3
     ROOT_LOGGER = 'root'
 
+    # Name of the console handler added to the root logger (see _add_console)
+    CONSOLE_HANDLER = 'console'
+
+    # Module (non-root) loggers by (calling file, parameters); see __new__
+    _INSTANCES = {}
+
+    def __new__(
+            cls, filename: Optional[str] = None, default_level: Optional[str] = None,
+            added_depth: int = 0, project: Optional[str] = None, set_root: bool = False,
+            test_name: Optional[str] = None) -> 'Logger':
+        """
+        Return the existing Logger if the calling module already built one with the same parameters (a module
+        logger does not change once it is built). Root loggers are always built, since they reconfigure logging.
+
+        """
+        if set_root or filename is not None:
+            return super().__new__(cls)
+
+        key = (_getframe(1 + int(added_depth)).f_code.co_filename, default_level, added_depth, project, test_name)
+        instance = cls._INSTANCES.get(key)
+        if instance is None:
+            instance = cls._INSTANCES[key] = super().__new__(cls)
+        return instance
+
     def __init__(
             self, filename: Optional[str] = None, default_level: Optional[str] = None,
             added_depth: int = 0, project: Optional[str] = None, set_root: bool = False,
@@ -153,6 +245,10 @@ class Logger:
                     in log preamable for validation
 
         """
+        # A cached module logger (see __new__) is already initialized
+        if getattr(self, 'logger', None) is not None:
+            return
+
         self.filename = filename
         self.loglevel = default_level or self.DEFAULT_LOG_LEVEL
         self.depth = self.DEFAULT_STACK_DEPTH + int(added_depth)
@@ -178,6 +274,9 @@ class Logger:
         # Reason: Updating the config with handlers attached is a 'no-op'
         if self.root:
 
+            # If the root logger was already configured, take back the handlers from its listener
+            self.stop()
+
             # Store (copy) the list of handlers associated with the root handler
             handlers = logging.root.handlers[:]
 
@@ -188,9 +287,13 @@ class Logger:
             # Initialize the root handler
             self._start_logger()
 
-            # Re-associate the handlers to the root handler
+            # Re-associate the handlers to the root handler (the root logger added its own console)
             for handler in handlers:
-                logging.root.addHandler(handler)
+                if handler.name != self.CONSOLE_HANDLER:
+                    logging.root.addHandler(handler)
+
+            # Write the records from a background thread, so logging does not block on console/file I/O
+            self._start_listener()
 
         else:
             # Start the logger for the given module.
@@ -213,8 +316,10 @@ class Logger:
             'filemode': self.FILE_MODE
         }
 
+        # basicConfig is a no-op once the root logger has a handler, so create the log file before adding the console.
         if self.filename is not None:
             default_config['filename'] = self.filename
+            logging.basicConfig(**default_config)
 
         self._add_console()
         logging.basicConfig(**default_config)
@@ -241,6 +346,48 @@ class Logger:
         if self.DEBUG_MODULE:
             print(f"Configured Logger: {self.name}")
 
+    def _start_listener(self) -> None:
+        """
+        Move the root logger's handlers behind a queue: the root logger only enqueues each record (the message
+        and calling context are already resolved), and a QueueListener thread writes the records to the handlers.
+
+        :return: None
+
+        """
+        global _LISTENER
+
+        root = logging.getLogger()
+        handlers = root.handlers[:]
+        for handler in handlers:
+            root.removeHandler(handler)
+
+        log_queue = queue.SimpleQueue()
+        _LISTENER = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _LISTENER.start()
+        root.addHandler(QueueHandler(log_queue))
+        atexit.register(self.stop)
+
+    @staticmethod
+    def stop() -> None:
+        """
+        Stop the background listener (if running), after it has written all of the queued records, and return
+        its handlers to the root logger (so any later records are written directly).
+
+        :return: None
+
+        """
+        global _LISTENER
+
+        if _LISTENER is not None:
+            _LISTENER.stop()
+            root = logging.getLogger()
+            for handler in root.handlers[:]:
+                if isinstance(handler, QueueHandler):
+                    root.removeHandler(handler)
+            for handler in _LISTENER.handlers:
+                root.addHandler(handler)
+            _LISTENER = None
+
     @staticmethod
     def determine_project():
         """
@@ -250,8 +397,11 @@ class Logger:
         Returns: Path of invoking file (without filename)
 
         """
-        frame_info = inspect.stack()[-1]
-        filename = str(os.path.abspath(frame_info.filename))
+        # Walk back to the outermost frame (the entry point)
+        frame = _getframe(0)
+        while frame.f_back is not None:
+            frame = frame.f_back
+        filename = str(os.path.abspath(frame.f_code.co_filename))
         filename_parts = filename.split(os.path.sep)
         return os.path.sep.join(filename_parts[:-1])
 
@@ -263,10 +413,18 @@ class Logger:
 
         :return: None
         """
+        # Every module instantiates a Logger; only add one console handler (the root logger's console replaces
+        # the one added by the modules, see __init__), otherwise each record is written once per module.
+        root = logging.getLogger(self.ROOT_LOGGER)
+        handlers = root.handlers + (list(_LISTENER.handlers) if _LISTENER is not None else [])
+        if any(handler.name == self.CONSOLE_HANDLER for handler in handlers):
+            return
+
         console = logging.StreamHandler()
+        console.set_name(self.CONSOLE_HANDLER)
         console.setLevel(self.loglevel)
         console.setFormatter(logging.Formatter(self.LOG_FORMAT))
-        logging.getLogger(self.ROOT_LOGGER).addHandler(console)
+        root.addHandler(console)
 
     def _get_module_name(self) -> str:
         """
@@ -274,8 +432,8 @@ class Logger:
 
         :return: string - dotted path lib
         """
-        frame_info = inspect.stack()[self.depth]
-        filename = str(os.path.abspath(frame_info.filename).split(
+        frame = _getframe(self.depth)
+        filename = str(os.path.abspath(frame.f_code.co_filename).split(
             f'{self.project}{os.path.sep}')[-1])
 
         return self._translate_to_dotted_lib_path(filename)
@@ -292,7 +450,13 @@ class Logger:
 
         :return: None
         """
-        log_routine = getattr(self.logger, level.lower())
+        routine, level_value = self.LEVEL_ROUTINES.get(level) or self.LEVEL_ROUTINES[level.upper()]
+
+        # Skip the calling context lookup and message building if the level is not enabled
+        if not self.logger.isEnabledFor(level_value):
+            return
+
+        log_routine = getattr(self.logger, routine)
         log_routine(str(prefix) + str(msg), extra=self._method())
 
     def _list_loggers(self) -> List[List[str]]:
@@ -363,17 +527,38 @@ class Logger:
         + Calling routine
         + Process pid
 
-        :return: Dictionary of values listed above.
+        :return: Dictionary of values listed above (reused per thread; logging copies it into the record).
 
         """
-        frame_info = inspect.stack()[self.depth]
-        filename = str(os.path.abspath(frame_info[1]).split(
-            f'{self.project}{os.path.sep}')[-1])
+        frame = _getframe(self.depth)
+        extra = getattr(_EXTRA, 'extra', None)
+        if extra is None:
+            extra = _EXTRA.extra = {}
+        extra['file_name'] = ContextAdapter._module_path(frame.f_code.co_filename, self.project)
+        extra['linenum'] = frame.f_lineno
+        extra['routine'] = frame.f_code.co_name
+        extra['pid'] = _PID
+        return extra
+
+    def is_enabled_for(self, level: int) -> bool:
+        """
+        Check if messages of the given level will be emitted (so callers can skip building expensive messages)
+
+        :param level: logging.LEVEL
 
-        return {'file_name': self._translate_to_dotted_lib_path(path=filename),
-                'linenum': frame_info[2],
-                'routine': frame_info[3],
-                'pid': os.getpid()}
+        :return: True if the logger is enabled for the level
+
+        """
+        return self.logger.isEnabledFor(level)
+
+    def is_debug(self) -> bool:
+        """
+        Check if DEBUG messages will be emitted (so callers can skip building expensive debug messages)
+
+        :return: True if the logger is enabled for DEBUG messages
+
+        """
+        return self.logger.isEnabledFor(self.DEBUG)
 
     # Quick class level references to logger methods.
     # ------------------------------------------------------------------
@@ -418,7 +603,7 @@ class Logger:
         :return: None
 
         """
-        self.warn(msg)
+        self._log_level(level='WARN', msg=msg)
 
     def info(self, msg) -> None:
         """
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
 import pprint
 import typing
 
@@ -28,7 +29,16 @@ class BounceMetricConstants:
 
 
 class BounceMetrics(MetricsBase):
-    def __init__(self, pillar: str, pillar_data: typing.Dict[str, dict], dates: typing.List[str] = None):
+
+    # Columns of the table of bounced defects (the transition history is left aligned; the others are centered)
+    TABLE_FIELDS = ['Pillar', 'Project', 'Defect ID', 'Violation', 'Transition History']
+    TABLE_LEFT_ALIGNED = 'Transition History'
+
+    # Tables with more rows than this are formatted directly instead of by prettytable; see table_string().
+    FAST_TABLE_ROWS = 500
+
+    def __init__(self, pillar: str, pillar_data: typing.Dict[str, typing.Dict[str, typing.Iterable[Bug]]],
+                 dates: typing.List[str] = None):
         super(MetricsBase, self).__init__()
         self.pillar = pillar
         self.data = pillar_data
@@ -52,50 +62,68 @@ class BounceMetrics(MetricsBase):
         """
         summary = {}
         bounced = {}
-        for project in self.data[self.pillar].keys():
-            defects = self.data[self.pillar][project]
+        debug = logging.is_debug()
 
-            bounced[project] = {}
-            summary[project] = {
-                BounceMetricConstants.BOUNCED: 0,
-                BounceMetricConstants.TOTAL: 0,
-                BounceMetricConstants.VIOLATIONS: []}
+        # Start of the reporting interval (if no dates are specified, no defects are excluded by their closing date)
+        interval_start_date = None
+        if self.dates:
+            interval_start_date = datetime(*[int(x) for x in self.dates[0].split(BugKeys.DATE_DELIMITER)])
 
-            logging.debug(f"Number of defects found for {self.pillar}:{project}: {len(defects)}")
+        # Local references for the per-defect loop
+        closed_state = BounceMetricConstants.CLOSED
+        sla_limit = BounceMetricConstants.SLA_LIMIT
+        scan_states = self._scan_states
 
-            for defect in defects:
+        for project, defects in self.data[self.pillar].items():
+            project_bounced = bounced[project] = {}
+            violations = []
+            total = num_bounced = num_defects = 0
+
+            # The defects may be any iterable (e.g. - a generator), so they are only iterated once.
+            for num_defects, defect in enumerate(defects, start=1):
 
                 # Don't include defects that are not closed yet... more can happen, so do not report.
-                # Also check to make sure CLOSED is the last/current state.
-                if (BounceMetricConstants.CLOSED not in defect.states_unique_summary or
-                        defect.states_unique_summary[-1] != BounceMetricConstants.CLOSED):
+                # (The raw summary is used: it ends in the same state as states_unique_summary, which is built
+                # on each access, and _scan_states skips the repeated states itself.)
+                states_summary = defect.states_summary
+                if not states_summary or states_summary[-1] != closed_state:
                     continue
 
                 # If a defect has been updated (e.g. - comments) but did not change to the closed state within the
                 # specified interval, do not include that defect in the analysis.
-                interval_start_date = datetime(*[int(x) for x in self.dates[0].split(BugKeys.DATE_DELIMITER)])
-                was_closed_before_interval = defect.states[-1].timestamp < interval_start_date
-
-                logging.debug(f"Checking if defect {defect.defect_id} was closed before the start interval.")
-                logging.debug(f"\tTIMESTAMP {defect.states[-1].timestamp }")
-                logging.debug(f"\tINTERVAL: {interval_start_date}")
-                logging.debug(f"\tPRECEDES? {was_closed_before_interval}")
-                if defect.states_unique_summary[-1] == BounceMetricConstants.CLOSED and was_closed_before_interval:
-                    logging.debug(f"Excluding {defect.defect_id} from analysis.")
+                closed_time = defect.states[-1].timestamp
+                was_closed_before_interval = interval_start_date is not None and closed_time < interval_start_date
+
+                if debug:
+                    logging.debug(f"Checking if defect {defect.defect_id} was closed before the start interval.")
+                    logging.debug(f"\tTIMESTAMP {closed_time}")
+                    logging.debug(f"\tINTERVAL: {interval_start_date}")
+                    logging.debug(f"\tPRECEDES? {was_closed_before_interval}")
+                if was_closed_before_interval:
+                    if debug:
+                        logging.debug(f"Excluding {defect.defect_id} from analysis.")
                     continue
 
                 # These defects have been closed at least once... so look for bounces
-                summary[project][BounceMetricConstants.TOTAL] += 1
-                if self.defect_bounce_count(defect) > 0:
-                    summary[project][BounceMetricConstants.BOUNCED] += 1
+                total += 1
+                bounces, opens = scan_states(states_summary)
+                if bounces > 0:
+                    num_bounced += 1
 
                     # If there are more 'open' states than the SLA limit, it is a SLA violation
-                    if defect.states_unique_summary.count(BounceMetricConstants.OPEN) > BounceMetricConstants.SLA_LIMIT:
-                        summary[project][BounceMetricConstants.VIOLATIONS].append(defect)
+                    if opens > sla_limit:
+                        violations.append(defect)
+
+                    project_bounced[defect.defect_id] = defect
+                    if debug:
+                        logging.debug(f"BOUNCE FOUND: {self.pillar}:{project}:{defect.defect_id}")
+                        logging.debug(f"Transition history: {defect.states_unique_summary}")
 
-                    bounced[project][defect.defect_id] = defect
-                    logging.debug(f"BOUNCE FOUND: {self.pillar}:{project}:{defect.defect_id}")
-                    logging.debug(f"Transition history: {defect.states_unique_summary}")
+            logging.debug(f"Number of defects found for {self.pillar}:{project}: {num_defects}")
+            summary[project] = {
+                BounceMetricConstants.BOUNCED: num_bounced,
+                BounceMetricConstants.TOTAL: total,
+                BounceMetricConstants.VIOLATIONS: violations}
 
         return bounced, summary
 
@@ -109,54 +137,110 @@ class BounceMetrics(MetricsBase):
         :return: Count of test->open transitions; 0 = no bounces
 
         """
-        count = 0
-        transition_list = bug_obj.states_unique_summary
-        num_transistions = len(transition_list) - 1
+        return BounceMetrics._scan_states(bug_obj.states_unique_summary)[0]
+
+    @staticmethod
+    def _scan_states(states: typing.List[str]) -> typing.Tuple[int, int]:
+        """
+        Count the 'test' --> 'open' transitions (bounces) and the 'open' states in a single pass over the states.
+
+        :param states: Normalized state transitions (Bug.states_summary or Bug.states_unique_summary; consecutive
+                       repeats of a state are skipped, so both give the same counts)
+
+        :return: Tuple of (count of test->open transitions, count of open states)
+
+        """
+        # The normalized states are lower case (or None, for unmapped states), so compare them directly.
+        # Every adjacent pair is checked, so a bounce right after creation (new -> test -> open) is counted too.
+        bounces = opens = 0
+        previous = None
+        for state in states:
+            if state == previous:
+                continue
+            if state == BounceMetricConstants.OPEN:
+                opens += 1
+                if previous == BounceMetricConstants.TEST:
+                    bounces += 1
+            previous = state
+        return bounces, opens
+
+    def table_rows(self) -> typing.List[list]:
+        """
+        Get the rows of the table of bounced defects.
+
+        :return: List of rows (one row per bounced defect; one row for each project without any bounces)
 
-        # Need at least two state changes to have a bounce... (new bugs can't bounce)
-        if num_transistions > 2:
-            for index in range(num_transistions):
-                current_state = transition_list[index]
-                next_state = transition_list[index + 1]
-                if (None not in [current_state, next_state] and
-                        current_state.lower() == BounceMetricConstants.TEST and
-                        next_state.lower() == BounceMetricConstants.OPEN):
-                    count += 1
-        return count
+        """
+        if logging.is_debug():
+            logging.debug(f"Bounce-back results:\n{pprint.pformat(self.bounces)}")
+
+        rows = []
+        for project, project_bounces in self.bounces.items():
+            project_name = project.upper()
+            if project_bounces:
+                # The SLA violations were determined by find_bounces()
+                violation_ids = {defect.defect_id for defect in
+                                 self.summary[project][BounceMetricConstants.VIOLATIONS]}
+                for defect_id, defect in project_bounces.items():
+                    violation = "*" if defect_id in violation_ids else ''
+                    rows.append([self.pillar, project_name, defect_id, violation, defect.states_unique_summary])
+            else:
+                rows.append([self.pillar, project_name, "No bounce backs", "", ""])
+        return rows
 
-    def build_table(self) -> prettytable.PrettyTable:
+    def build_table(self, rows: typing.List[list] = None) -> prettytable.PrettyTable:
         """
         Build a table of bounced defects.
 
+        :param rows: Rows of the table (default: table_rows())
+
         :return: prettyTable of tallied results
 
         """
-        # Define column header names
-        pillar = 'Pillar'
-        project_name = 'Project'
-        defect_id = 'Defect ID'
-        sla = 'Violation'
-        history = 'Transition History'
-
-        # Define the table
         table = prettytable.PrettyTable()
-        table.field_names = [pillar, project_name, defect_id, sla, history]
-        table.align[history] = 'l'
-
-        # Iterate through the data
-        logging.debug(f"Bounce-back results:\n{pprint.pformat(self.bounces)}")
-        for project in self.bounces.keys():
-            data_row = [self.pillar, project.upper(), "No bounce backs", "", ""]
-            if self.bounces[project]:
-                for defect_id, defect in self.bounces[project].items():
-                    violation = "*" if (defect.states_unique_summary.count(BounceMetricConstants.OPEN) >
-                                        BounceMetricConstants.SLA_LIMIT) else ''
-                    data_row = [self.pillar, project.upper(), defect_id, violation, defect.states_unique_summary]
-                    table.add_row(data_row)
-            else:
-                table.add_row(data_row)
+        table.field_names = self.TABLE_FIELDS
+        table.align[self.TABLE_LEFT_ALIGNED] = 'l'
+        for row in (rows if rows is not None else self.table_rows()):
+            table.add_row(row)
         return table
 
+    def table_string(self) -> str:
+        """
+        Get the table of bounced defects as a string. prettytable is slow for thousands of rows, so large (ASCII)
+        tables are formatted directly, in the same layout.
+
+        :return: String representation of the table
+
+        """
+        rows = self.table_rows()
+        if len(rows) > self.FAST_TABLE_ROWS:
+            str_rows = [[str(cell) for cell in row] for row in rows]
+            if all(cell.isascii() for row in str_rows for cell in row):
+                return self._format_table(str_rows)
+        return self.build_table(rows).get_string()
+
+    def _format_table(self, rows: typing.List[typing.List[str]]) -> str:
+        """
+        Format the rows in prettytable's default layout (for ASCII content, where the length is the display width).
+
+        :param rows: Rows of the table (cells converted to str)
+
+        :return: String representation of the table
+
+        """
+        widths = [max(map(len, column)) for column in zip(self.TABLE_FIELDS, *rows)]
+        left_aligned = [field == self.TABLE_LEFT_ALIGNED for field in self.TABLE_FIELDS]
+        border = f"+{'+'.join('-' * (width + 2) for width in widths)}+"
+
+        def format_row(cells: typing.List[str]) -> str:
+            return "| " + " | ".join(cell.ljust(width) if left else cell.center(width)
+                                     for cell, width, left in zip(cells, widths, left_aligned)) + " |"
+
+        lines = [border, format_row(self.TABLE_FIELDS), border]
+        lines.extend(map(format_row, rows))
+        lines.append(border)
+        return "\n".join(lines)
+
     def build_report(self) -> str:
         """
         Get the table and summarize the results.
@@ -164,13 +248,13 @@ class BounceMetrics(MetricsBase):
         :return: String representation of the table and the summary
 
         """
-        report = ("NOTE: All defects in tally have been updated within the specified range "
-                  f"and have been closed at least once.\n\nSLA Limit: {BounceMetricConstants.SLA_LIMIT} "
-                  f"bounces.\n\nStats")
+        report = [("NOTE: All defects in tally have been updated within the specified range "
+                   f"and have been closed at least once.\n\nSLA Limit: {BounceMetricConstants.SLA_LIMIT} "
+                   f"bounces.\n\nStats")]
 
         if self.dates:
-            report += f" for {self.dates[0]} - {self.dates[1]}"
-        report += ":\n"
+            report.append(f" for {self.dates[0]} - {self.dates[1]}")
+        report.append(":\n")
 
         violations = []
 
@@ -191,28 +275,29 @@ class BounceMetrics(MetricsBase):
                 percentage = 0.0
 
             # Append results to the report
-            report += (f"\t- {project.upper():<8}   Defects: {total:3}  Bounced: {bounced:2}  "
-                       f"Violations: {num_violations:2}    Percent Bounced Back: {percentage:4.1f}%\n")
+            report.append(f"\t- {project.upper():<8}   Defects: {total:3}  Bounced: {bounced:2}  "
+                          f"Violations: {num_violations:2}    Percent Bounced Back: {percentage:4.1f}%\n")
 
         # Add the results table
-        report += f"\n\n{self.build_table().get_string()}\n"
+        report.append(f"\n\n{self.table_string()}\n")
 
         # List the defect details for all defects that violated the SLA
-        report += "\nVIOLATION DETAILS:\n"
+        report.append("\nVIOLATION DETAILS:\n")
         if violations:
-            for defect in violations:
-                report += f"{str(defect)}\n\n"
+            report.extend(f"{str(defect)}\n\n" for defect in violations)
         else:
-            report += "None"
+            report.append("None")
+        report = ''.join(report)
 
-        logging.debug(f"Rework Report:\n{report}")
+        if logging.is_debug():
+            logging.debug(f"Rework Report:\n{report}")
 
         return report
 
     def write_report(self, filename: str) -> typing.NoReturn:
         """ Display and write the results to file (be sure to include metric type in the file name). """
-        logging.info(f"\n\n{'*' * 120}\n\n{self.report}\n\n")
+        if logging.is_enabled_for(Logger.INFO):
+            logging.info(f"\n\n{'*' * 120}\n\n{self.report}\n\n")
         rpt_name = filename.format(metric="bounce")
-        with open(rpt_name, "w") as FILE:
-            FILE.write(f"\n{self.report}\n")
+        Path(rpt_name).write_text(f"\n{self.report}\n", encoding="utf-8")
         logging.info(f"Wrote bounce report to '{rpt_name}'")
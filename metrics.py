@@ -1,10 +1,17 @@
 #!/usr/bin/env python
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import re
+import threading
 import typing
 
+import requests
+
 from defect_metrics.config.cfg_mappings import get_configuration, get_pillars
 from defect_metrics.config.command_line import CommandLine
-from defect_metrics.jira_client.jira_client import JiraClient
+from defect_metrics.defect_models.bug_model import Bugs
+from defect_metrics.jira_client.jira_client import JiraClient, RateLimiter
 from defect_metrics.jira_client.jira_mappings import JiraFields
 import defect_metrics.logging.logger as logger
 from defect_metrics.metrics.bouncemetrics import BounceMetrics
@@ -14,19 +21,41 @@ BORDER_LENGTH = 120
 BORDER = BORDER_CHAR * BORDER_LENGTH
 DEFECT_TYPE = "defect"
 
+QUERY_BANNER = f"\n{BORDER}\n*     Querying defects for {{pillar}}:{{projects}}\n{BORDER}\n"
+NO_RESULTS_MSG = ("No defect info was returned for {pillar}:{project}. \n"
+                  "Possible issues:\n"
+                  "\t* there is a problem with the query,\n"
+                  "\t* the query did not return any defect info, or\n"
+                  "\t* Jira is not allowing the query to execute. Enable debug to assess issue.\n\n")
+
+# Pillar name (compared case-insensitively) that selects all defined pillars
+ALL_PILLARS = CommandLine.consts.ALL.lower()
+
+# Number of pillars processed, and projects (per pillar) queried, at the same time
+# (each query also processes its issues in a thread pool)
+PILLAR_CONCURRENCY = 4
+PROJECT_CONCURRENCY = 4
+
+# CLI date: YY-MM-DD or YYYY-MM-DD
+DATE_PATTERN = re.compile(r'^(\d{2}|\d{4})-(\d{1,2})-(\d{1,2})$')
+
 
 def format_date(date_string: str) -> str:
     """
-    Format the strinh date provided on the CLI
+    Format the string date provided on the CLI
 
-    :param date_string: string of date : YY/MM/DD
+    :param date_string: string of date : YY-MM-DD or YYYY-MM-DD
 
-    :return: str of date with full formatting
+    :return: str of date with full formatting: YYYY/MM/DD
 
     """
+    match = DATE_PATTERN.match(date_string)
+    if match is None:
+        raise ValueError(f"Invalid date '{date_string}': expected YYYY-MM-DD")
+
     delimiter = "/"
-    year, month, day = date_string.split('-')
-    if int(year) < 100:
+    year, month, day = match.groups()
+    if len(year) == 2:
         year = f"20{year}"
     return f"{year}{delimiter}{int(month):02}{delimiter}{int(day):02}"
 
@@ -47,33 +76,99 @@ def get_jira_data(client: JiraClient, pillar: str, projects: typing.List[str],
     """
     all_defects = {pillar: {}}
 
-    # Iterate through projects defined in pillar
-    for project in projects:
-        logging.info(f"\n{BORDER}\n*     Querying defects for {pillar}:{project.upper()}\n{BORDER}\n")
+    # The banners are only built if they will be logged.
+    log_info = logging.is_enabled_for(logger.Logger.INFO)
+
+    # Build Jira data filter
+    query_params = {JiraFields.ISSUETYPE: DEFECT_TYPE}
+    if status is not None:
+        query_params[JiraFields.STATUS] = status
 
-        # Build Jira data filter
-        query_params = {JiraFields.PROJECT: f"'{project}'", JiraFields.ISSUETYPE: DEFECT_TYPE}
-        if status is not None:
-            query_params[JiraFields.STATUS] = status
+    # BounceMetrics excludes defects whose last state change precedes the interval, so do not request them.
+    jql_clauses = []
+    if len(client.date_range) == 2:
+        jql_clauses.append(f'{JiraFields.STATUS} CHANGED AFTER "{client.date_range[0]}"')
+
+    def query_project(project: str) -> Bugs:
+        if log_info:
+            logging.info(QUERY_BANNER.format(pillar=pillar, projects=project.upper()))
 
         # Query Jira
-        results_list = client.query(query_params_dict=query_params)
+        return client.query(query_params_dict={JiraFields.PROJECT: project, **query_params}, jql_clauses=jql_clauses)
+
+    # Query all of the projects defined in the pillar with a single search (grouped by project afterwards).
+    if log_info:
+        logging.info(QUERY_BANNER.format(pillar=pillar, projects=', '.join(projects or []).upper()))
+    results = {}
+    if projects:
+        results = client.query_projects(projects=projects, query_params_dict=query_params, jql_clauses=jql_clauses)
+
+    # If the results could not be grouped by project, query the projects separately and concurrently (each query
+    # is mostly waiting on Jira); map() returns the results in the order of the projects.
+    if results is None:
+        with ThreadPoolExecutor(max_workers=max(1, min(PROJECT_CONCURRENCY, len(projects)))) as executor:
+            results = dict(zip(projects, executor.map(query_project, projects)))
+
+    for project, results_list in results.items():
 
         # Check for results and if found, store the populated Bug object list by pillar and project
         if results_list:
             all_defects[pillar][project] = results_list
 
         else:
-            logging.info(f"No defect info was returned for {pillar}:{project}. "
-                         f"\nPossible issues:\n"
-                         "\t* there is a problem with the query,\n"
-                         "\t* the query did not return any defect info, or\n"
-                         "\t* Jira is not allowing the query to execute. Enable debug to assess issue.\n\n")
+            if log_info:
+                logging.info(NO_RESULTS_MSG.format(pillar=pillar, project=project))
             all_defects[pillar][project] = []
 
     return all_defects
 
 
+def process_pillar(pillar: str, cli_args: CommandLine, dates: typing.List[str], date_str: str,
+                   logging: logger.Logger, rate_limiter: RateLimiter = None,
+                   get_session: typing.Callable[[str], requests.Session] = None) -> typing.NoReturn:
+    """
+    Query Jira for the pillar's defects, and calculate and write the pillar's metric reports
+
+    :param pillar: Name of the pillar
+    :param cli_args: Parsed command line arguments
+    :param dates: Date range of the query: [start, end]
+    :param date_str: Date range portion of the report file names
+    :param logging: Instantiated logging for recording data
+    :param rate_limiter: Limit on the rate of Jira requests, shared by all pillars (None = no limit)
+    :param get_session: Returns the HTTP session (shared by the pillars) for a Jira URL; if None, the pillar's
+                        client creates its own session.
+
+    :return: None
+
+    """
+    results_file = f"defects.{pillar}{date_str}.{{metric}}.report"
+
+    # Setup logging
+    logging.debug(f"Logging Project: {logging.project}")
+
+    # Get Jira and Pillar configurations
+    cfg_map = get_configuration(mapping_file=cli_args.args.cfg, pillar=pillar)
+    jira_url = cfg_map.get_url()
+    defined_projects = cfg_map.get_projects()
+
+    # Log the query parameters
+    if logging.is_enabled_for(logger.Logger.INFO):
+        logging.info(f"\n\nPILLAR: {pillar}\nPROJECTS: {defined_projects}\n"
+                     f"URL: {jira_url}\nDates: {dates[0]} to {dates[1]}\n")
+
+    # Instantiate client, and get the defect data (the client's own connections are closed once the data is
+    # retrieved; a shared session is closed by the caller)
+    session = get_session(jira_url) if get_session is not None else None
+    with JiraClient(jira_url=jira_url, username=cli_args.args.user, pswd=cli_args.args.pswd,
+                    pillar=pillar, mapping=cfg_map, date_range=dates, batch_size=cli_args.args.batch_size,
+                    concurrency=cli_args.args.jira_concurrency, cache_dir=cli_args.args.cache_dir,
+                    cache_ttl=cli_args.args.cache_ttl, rate_limiter=rate_limiter, session=session) as client:
+        defects = get_jira_data(client=client, pillar=pillar, projects=defined_projects, logging=logging)
+
+    # Calculate and record the Bounce Rate metrics
+    BounceMetrics(pillar=pillar, pillar_data=defects, dates=dates).write_report(filename=results_file)
+
+
 def main(cli_args: CommandLine) -> typing.NoReturn:
 
     # List pillars and projects if requested.
@@ -87,7 +182,7 @@ def main(cli_args: CommandLine) -> typing.NoReturn:
 
     # If ALL reports are to be run, update pillar list to include all defined pillars.
     pillar_list = cli_args.args.pillar
-    if CommandLine.consts.ALL.lower() in [x.lower() for x in pillar_list]:
+    if any(pillar.lower() == ALL_PILLARS for pillar in pillar_list):
         pillar_list = get_pillars(cli_args.args.cfg)
 
     # Determine log file name
@@ -98,31 +193,30 @@ def main(cli_args: CommandLine) -> typing.NoReturn:
     logging_level = logger.Logger.STR_TO_VAL['debug' if cli_args.args.debug else 'info']
     logging = logger.Logger(default_level=logging_level, filename=logfile, project="defect_metrics", set_root=True)
 
-    for pillar in pillar_list:
-        print(f"+{BORDER}+\n|{pillar:^{BORDER_LENGTH}}|\n+{BORDER}+\n")
-        results_file = f"defects.{pillar}{date_str}.{{metric}}.report"
-
-        # Setup logging
-        logging.debug(f"Logging Project: {logging.project}")
-
-        # Get Jira and Pillar configurations
-        cfg_map = get_configuration(mapping_file=cli_args.args.cfg, pillar=pillar)
-        jira_url = cfg_map.get_url()
-        defined_projects = cfg_map.get_projects()
-
-        # Log the query parameters
-        logging.info(f"\n\nPILLAR: {pillar}\nPROJECTS: {defined_projects}\n"
-                     f"URL: {jira_url}\nDates: {dates[0]} to {dates[1]}\n")
-
-        # Instantiate client
-        client = JiraClient(jira_url=jira_url, username=cli_args.args.user, pswd=cli_args.args.pswd,
-                            pillar=pillar, mapping=cfg_map, date_range=dates)
-
-        # Get the defect data
-        defects = get_jira_data(client=client, pillar=pillar, projects=defined_projects, logging=logging)
-
-        # Calculate and record the Bounce Rate metrics
-        BounceMetrics(pillar=pillar, pillar_data=defects, dates=dates).write_report(filename=results_file)
+    # Pillars on the same Jira instance share an HTTP session (connections and the Jira session cookie)
+    sessions = {}
+    sessions_lock = threading.Lock()
+
+    def get_session(jira_url: str) -> requests.Session:
+        with sessions_lock:
+            key = (jira_url, cli_args.args.user)
+            if key not in sessions:
+                sessions[key] = JiraClient.create_session(username=cli_args.args.user, pswd=cli_args.args.pswd)
+            return sessions[key]
+
+    # Process the pillars concurrently (each pillar has its own client, configuration and report file). The
+    # pillar banners are printed here, in pillar order, as each pillar completes.
+    rate_limiter = RateLimiter(cli_args.args.jira_rps) if cli_args.args.jira_rps else None
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, min(PILLAR_CONCURRENCY, len(pillar_list)))) as executor:
+            results = executor.map(partial(process_pillar, cli_args=cli_args, dates=dates, date_str=date_str,
+                                           logging=logging, rate_limiter=rate_limiter, get_session=get_session),
+                                   pillar_list)
+            for pillar, _ in zip(pillar_list, results):
+                print(f"+{BORDER}+\n|{pillar:^{BORDER_LENGTH}}|\n+{BORDER}+\n")
+    finally:
+        for session in sessions.values():
+            session.close()
 
     logging.info("Processing complete.")
 
@@ -0,0 +1,84 @@
+import os
+import tempfile
+import typing
+import unittest
+
+from defect_metrics.config import cfg_mappings
+from defect_metrics.config.cfg_mappings import YamlFile
+from defect_metrics.jira_client.jira_client import JiraClient
+from defect_metrics.jira_client.jira_mappings import JiraFields
+import defect_metrics.logging.logger as logger
+import metrics
+
+MAPPINGS_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'mappings.yaml')
+PILLAR = 'ERP'
+PROJECTS = ['EBS', 'FMW', 'NOPE']
+
+
+def make_issue(key: str) -> typing.Dict:
+    """ Minimal search result for an issue that went new --> in development --> closed """
+    histories = [{'created': '2019-09-02T10:00:00.000+0000',
+                  'items': [{'field': 'status', 'fromString': 'New', 'toString': 'In Development'}]},
+                 {'created': '2019-09-03T10:00:00.000+0000',
+                  'items': [{'field': 'status', 'fromString': 'In Development', 'toString': 'Closed'}]}]
+    return {'key': key,
+            'fields': {'summary': f'Summary of {key}', 'created': '2019-09-01T09:00:00.000+0000',
+                       'status': {'name': 'Closed'}, 'project': {'key': key.split('-')[0]}},
+            'changelog': {'startAt': 0, 'maxResults': len(histories), 'total': len(histories),
+                          'histories': histories}}
+
+
+class FakeJiraClient(JiraClient):
+    """ JiraClient whose searches are answered locally: a search of an unknown project fails (as Jira does) """
+
+    ISSUES = {'EBS': [make_issue('EBS-1'), make_issue('EBS-2')], 'FMW': [make_issue('FMW-1')]}
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.searches = []
+
+    def _search_page(self, url: str, body: typing.Dict) -> typing.Optional[typing.Dict]:
+        jql = body[JiraFields.JQL]
+        self.searches.append(jql)
+        projects = [project for project in PROJECTS if f'"{project}"' in jql.upper()]
+        if any(project not in self.ISSUES for project in projects):
+            return None
+        issues = [issue for project in projects for issue in self.ISSUES[project]]
+        return {JiraFields.START_AT: 0, JiraFields.MAX_RESULTS: body[JiraFields.MAX_RESULTS],
+                JiraFields.TOTAL: len(issues), JiraFields.ISSUES: issues}
+
+
+class TestQueryProjects(unittest.TestCase):
+
+    def setUp(self):
+        # Keep the parsed config cache out of the user's home directory (and away from a stale cache there)
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.saved_cache_dir = cfg_mappings.CACHE_DIR
+        cfg_mappings.CACHE_DIR = self.cache_dir.name
+        cfg_mappings._load_memoized.cache_clear()
+        self.client = FakeJiraClient(jira_url='https://jira.example.com', mapping=YamlFile(MAPPINGS_FILE, PILLAR),
+                                     pillar=PILLAR)
+
+    def tearDown(self):
+        self.client.close()
+        cfg_mappings.CACHE_DIR = self.saved_cache_dir
+        cfg_mappings._load_memoized.cache_clear()
+        self.cache_dir.cleanup()
+
+    def test_failed_search_returns_none(self):
+        self.assertIsNone(self.client.query_projects(projects=PROJECTS, query_params_dict={}))
+
+    def test_search_groups_by_project(self):
+        results = self.client.query_projects(projects=['EBS', 'fmw'], query_params_dict={})
+        self.assertEqual({'EBS': ['EBS-1', 'EBS-2'], 'fmw': ['FMW-1']},
+                         {project: [bug.defect_id for bug in bugs] for project, bugs in results.items()})
+        self.assertEqual(1, len(self.client.searches))
+
+    def test_get_jira_data_falls_back_to_project_queries(self):
+        data = metrics.get_jira_data(client=self.client, pillar=PILLAR, projects=PROJECTS, logging=logger.Logger())
+        self.assertEqual({'EBS': 2, 'FMW': 1, 'NOPE': 0},
+                         {project: len(bugs) for project, bugs in data[PILLAR].items()})
+
+
+if __name__ == '__main__':
+    unittest.main()